@@ -1,4 +1,7 @@
 import logging
+from contextlib import closing, nullcontext
+from queue import Queue, Full
+from threading import Thread, Event
 from types import TracebackType
 from typing import Type, overload, Generator
 
@@ -7,9 +10,9 @@ from pandas import DataFrame
 from ...core.identifier import ColumnIdentifier
 from ...core.exceptions import ColumnIdentifierError
 from ...core.column import Column, BooleanColumn, StringColumn
-from .query import Query
+from .query import Query, sqlite_bulk_pragmas
 from .schema import SQLiteDataImportMode
-from .interface import DatabaseConnectorABC, Cursor
+from .interface import DatabaseConnectorABC, ConnectionProtocol, Cursor
 from .exceptions import TableAlreadyExists, ColumnDataTypeConversionError
 
 # set logger
@@ -26,6 +29,12 @@ class BaseConnector(DatabaseConnectorABC):
         object satisfying PEP 249.
     """
 
+    _shared_connection: bool = False
+    """
+        Flag to indicate if `_connect` returns the same connection on each call, 
+        instead of opening a new one (e.g. `HamanaConnector`).
+    """
+
     def __enter__(self):
         logger.debug("start")
         self.connection = self._connect()
@@ -58,8 +67,8 @@ class BaseConnector(DatabaseConnectorABC):
 
             column_name = column[0]
             column_type = column[1]
-            logger.debug(f"column: {column_name}, type: {column_type}")
-            logger.debug(f"column full info: {column}")
+            logger.debug("column: %s, type: %s", column_name, column_type)
+            logger.debug("column full info: %s", column)
 
             if column_type is not None:
                 try:
@@ -86,12 +95,12 @@ class BaseConnector(DatabaseConnectorABC):
         return None
 
     @overload
-    def execute(self, query: str) -> Query: ...
+    def execute(self, query: str, fetch_size: int | None = None) -> Query: ...
 
     @overload
-    def execute(self, query: Query) -> None: ...
+    def execute(self, query: Query, fetch_size: int | None = None) -> None: ...
 
-    def execute(self, query: Query | str) -> None | Query:
+    def execute(self, query: Query | str, fetch_size: int | None = None) -> None | Query:
         logger.debug("start")
 
         flag_query_str = isinstance(query, str)
@@ -114,15 +123,20 @@ class BaseConnector(DatabaseConnectorABC):
                     cursor.execute(query.query, params)
                 else:
                     cursor.execute(query.query)
-                logger.info(f"query: {query.query}")
-                logger.info(f"parameters: {query.get_params()}")
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("query: %s", query.query)
+                    logger.info("parameters: %s", params)
 
                 # set columns
                 columns = self.parse_cursor_description(cursor)
 
                 # fetch results
-                result = cursor.fetchall()
-                logger.info(f"data extracted ({len(result)} rows)")
+                if fetch_size is None:
+                    result = cursor.fetchall()
+                else:
+                    result = self._fetch_rows(cursor, fetch_size)
+                logger.info("data extracted (%d rows)", len(result))
 
                 cursor.close()
                 logger.debug("cursor closed")
@@ -142,11 +156,11 @@ class BaseConnector(DatabaseConnectorABC):
 
                 inferred_column = None
                 if columns[column_name] is None:
-                    logger.debug(f"column {column_name} still not inferred, default infering")
+                    logger.debug("column %s still not inferred, default infering", column_name)
                     try:
                         inferred_column = ColumnIdentifier.infer(df_result[column_name], column_name, i)
                     except ColumnIdentifierError:
-                        logger.warning(f"column {column_name} could not be inferred, defualting to string")
+                        logger.warning("column %s could not be inferred, defualting to string", column_name)
                         inferred_column = StringColumn(name = column_name, order = i)
 
                     columns[column_name] = inferred_column
@@ -163,73 +177,213 @@ class BaseConnector(DatabaseConnectorABC):
         logger.debug("end")
         return query if flag_query_str else None
 
+    def _fetch_rows(self, cursor: Cursor, fetch_size: int) -> list[tuple]:
+        """
+            Fetch all the rows of a query result with `fetchmany`. 
+            The cursor `arraysize` is set to `fetch_size`, so that 
+            each call retrieves up to `fetch_size` rows in a single 
+            round trip.
+
+            Parameters:
+                cursor: cursor used to execute the query.
+                fetch_size: number of rows fetched for each call.
+
+            Returns:
+                list containing the rows extracted.
+        """
+        logger.debug("start")
+
+        fetch_size = max(fetch_size, 1)
+        cursor.arraysize = fetch_size
+
+        result: list[tuple] = []
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+
+            if not rows:
+                break
+
+            result.extend(rows)
+
+        logger.debug("end")
+        return result
+
     def batch_execute(self, query: Query, batch_size: int) -> Generator[list[tuple], None, None]:
         logger.debug("start")
 
         # execute query
         try:
-            with self as conn:
-                logger.info("extracting data ...")
+            with self:
+                yield from self._fetch_batches(self.connection, query, batch_size)
+        except Exception as e:
+            logger.exception(e)
+            raise e
 
-                logger.debug("open cursor")
-                cursor = conn.connection.cursor()
-                logger.debug("cursor opened")
+        logger.debug("end")
+        return
 
-                # execute query
-                params = query.get_params()
-                if params is not None:
-                    cursor.execute(query.query, params)
-                else:
-                    cursor.execute(query.query)
-                logger.info(f"query: {query.query}")
-                logger.info(f"parameters: {query.get_params()}")
+    def _fetch_batches(self, connection: ConnectionProtocol, query: Query, batch_size: int) -> Generator[list[tuple], None, None]:
+        """
+            Execute a query with the connection provided and 
+            return the results in batches.
 
-                # fetch in batches
-                while True:
-                    results = cursor.fetchmany(batch_size)
+            Parameters:
+                connection: connection used to execute the query.
+                query: query to execute on database.
+                batch_size: size of the batch to return.
 
-                    if not results:
-                        break
+            Returns:
+                Generator used to return the results in batches.
+        """
+        logger.debug("start")
+        logger.info("extracting data ...")
 
-                    # set columns
-                    if query.columns is None:
-                        """
-                            Observe that this operation is executed only once 
-                            and only if the query object was not defined with columns.
-                        """
-                        logger.info("set query columns")
+        logger.debug("open cursor")
+        cursor = connection.cursor()
+        logger.debug("cursor opened")
 
-                        # get columns
-                        columns = self.parse_cursor_description(cursor)
+        # execute query
+        params = query.get_params()
+        if params is not None:
+            cursor.execute(query.query, params)
+        else:
+            cursor.execute(query.query)
 
-                        # create temporary DataFrame
-                        df_temp = DataFrame(results, columns = [column_name for column_name in columns])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("query: %s", query.query)
+            logger.info("parameters: %s", params)
 
-                        # get columns
-                        logger.debug("update query columns ...")
-                        for i, column_name in enumerate(columns):
+        # fetch in batches (driver buffer sized as the batch)
+        cursor.arraysize = batch_size
+        while True:
+            results = cursor.fetchmany(batch_size)
 
-                            inferred_column = None
-                            if columns[column_name] is None:
-                                logger.debug(f"column {column_name} still not inferred, default infering.")
-                                try:
-                                    inferred_column = ColumnIdentifier.infer(df_temp[column_name], column_name, i)
-                                except ColumnIdentifierError:
-                                    logger.warning(f"column {column_name} could not be inferred, defualting to string")
-                                    inferred_column = StringColumn(name = column_name, order = i)
+            if not results:
+                break
 
-                                columns[column_name] = inferred_column
+            # set columns
+            if query.columns is None:
+                """
+                    Observe that this operation is executed only once 
+                    and only if the query object was not defined with columns.
+                """
+                logger.info("set query columns")
 
-                        query.columns = [columns[column_name] for column_name in columns]
-                        logger.info("query column updated")
+                # get columns
+                columns = self.parse_cursor_description(cursor)
 
-                    yield results
+                # create temporary DataFrame
+                df_temp = DataFrame(results, columns = [column_name for column_name in columns])
 
-                cursor.close()
-                logger.debug("cursor closed")
-        except Exception as e:
-            logger.exception(e)
-            raise e
+                # get columns
+                logger.debug("update query columns ...")
+                for i, column_name in enumerate(columns):
+
+                    inferred_column = None
+                    if columns[column_name] is None:
+                        logger.debug("column %s still not inferred, default infering.", column_name)
+                        try:
+                            inferred_column = ColumnIdentifier.infer(df_temp[column_name], column_name, i)
+                        except ColumnIdentifierError:
+                            logger.warning("column %s could not be inferred, defualting to string", column_name)
+                            inferred_column = StringColumn(name = column_name, order = i)
+
+                        columns[column_name] = inferred_column
+
+                query.columns = [columns[column_name] for column_name in columns]
+                logger.info("query column updated")
+
+            yield results
+
+        cursor.close()
+        logger.debug("cursor closed")
+
+        logger.debug("end")
+        return
+
+    def batch_execute_overlapped(self, query: Query, batch_size: int, queue_size: int = 2) -> Generator[list[tuple], None, None]:
+        """
+            Function used to execute a query on the database and return the results 
+            in batches, similarly to `batch_execute`. Different from it, the batches 
+            are fetched by a background thread and stored into a bounded queue, so 
+            that the fetch of the next batch overlaps with the processing of the 
+            current one performed by the caller.
+
+            Observe that the background thread opens its own connection with `_connect`, 
+            and closes it at the end, so the connector can be used by the caller while 
+            the batches are consumed; at most `queue_size` batches (plus the one 
+            currently being fetched) are kept in memory.
+
+            Connectors sharing a single connection (e.g. `HamanaConnector`) cannot 
+            hand out a private one to the thread; in this case the batches are 
+            fetched without overlapping, as in `batch_execute`.
+
+            Parameters:
+                query: query to execute on database.
+                batch_size: size of the batch to return.
+                queue_size: maximum number of batches fetched in advance.
+
+            Returns:
+                Generator used to return the results in batches.
+        """
+        logger.debug("start")
+
+        if self._shared_connection:
+            logger.info("connection shared, extracting data without background thread")
+            yield from self.batch_execute(query, batch_size)
+            logger.debug("end")
+            return
+
+        batches: Queue = Queue(maxsize = queue_size)
+        stop = Event()
+        end_of_batches = object()
+
+        def put(item: object) -> None:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout = 0.1)
+                    return
+                except Full:
+                    continue
+
+        def fetch() -> None:
+            try:
+                # private connection, `self.connection` is never used by the thread
+                connection = self._connect()
+                try:
+                    with closing(self._fetch_batches(connection, query, batch_size)) as generator:
+                        for batch in generator:
+                            if stop.is_set():
+                                break
+                            put(batch)
+                finally:
+                    connection.close()
+                    logger.info("background connection closed")
+            except Exception as e:
+                logger.exception(e)
+                put(e)
+            finally:
+                put(end_of_batches)
+
+        # start fetching
+        logger.info("extracting data in background, queue size: %s", queue_size)
+        producer = Thread(target = fetch, name = "hamana-batch-execute", daemon = True)
+        producer.start()
+
+        try:
+            while True:
+                item = batches.get()
+
+                if item is end_of_batches:
+                    break
+
+                if isinstance(item, Exception):
+                    raise item
+
+                yield item # type: ignore (always list[tuple])
+        finally:
+            stop.set()
+            producer.join()
 
         logger.debug("end")
         return
@@ -240,7 +394,8 @@ class BaseConnector(DatabaseConnectorABC):
         table_name: str,
         raw_insert: bool = False,
         batch_size: int = 10_000,
-        mode: SQLiteDataImportMode = SQLiteDataImportMode.REPLACE
+        mode: SQLiteDataImportMode = SQLiteDataImportMode.REPLACE,
+        bulk: bool = False
     ) -> None:
         logger.debug("start")
 
@@ -282,47 +437,54 @@ class BaseConnector(DatabaseConnectorABC):
         logger.info(f"extracting data, batch size: {batch_size}")
         flag_first_batch = True
         hamana_cursor = hamana_connection.cursor()
-        for raw_batch in self.batch_execute(query, batch_size):
-
-            if flag_first_batch:
-                logger.info("generating insert query")
-                insert_query = query.get_insert_query(table_name_upper)
-                column_names = query.get_column_names()
-
-                # create table
-                if not flag_table_exists or mode == SQLiteDataImportMode.REPLACE:
-
-                    # drop if exists (for replace)
-                    if flag_table_exists:
-                        logger.info(f"drop table {table_name_upper}")
-                        hamana_cursor.execute(f"DROP TABLE {table_name_upper}")
-                        hamana_connection.commit()
-                        logger.debug("table dropped")
-
-                    logger.info(f"creating table {table_name_upper}")
-                    hamana_cursor.execute(query.get_create_query(table_name_upper))
-                    hamana_connection.commit()
-                    logger.debug("table created")
-
-                # set flag
-                flag_first_batch = False
-
-            # adjust data types
-            if raw_insert:
-                # no data type conversion
-                hamana_cursor.executemany(insert_query, raw_batch)
+        with sqlite_bulk_pragmas(hamana_connection) if bulk else nullcontext():
+            try:
+                for raw_batch in self.batch_execute(query, batch_size):
+
+                    if flag_first_batch:
+                        logger.info("generating insert query")
+                        insert_query = query.get_insert_query(table_name_upper)
+                        column_names = query.get_column_names()
+
+                        # create table
+                        if not flag_table_exists or mode == SQLiteDataImportMode.REPLACE:
+
+                            # drop if exists (for replace)
+                            if flag_table_exists:
+                                logger.info(f"drop table {table_name_upper}")
+                                hamana_cursor.execute(f"DROP TABLE {table_name_upper}")
+                                hamana_connection.commit()
+                                logger.debug("table dropped")
+
+                            logger.info(f"creating table {table_name_upper}")
+                            hamana_cursor.execute(query.get_create_query(table_name_upper))
+                            hamana_connection.commit()
+                            logger.debug("table created")
+
+                        # set flag
+                        flag_first_batch = False
+
+                    # adjust data types
+                    if raw_insert:
+                        # no data type conversion (committed at the end)
+                        hamana_cursor.executemany(insert_query, raw_batch)
+                    else:
+                        # create temporary query
+                        query_temp = Query(query = query.query, columns = query.columns)
+
+                        # assign result (adjust data types)
+                        df_temp = DataFrame(raw_batch, columns = column_names, dtype = "object")
+                        df_temp = query_temp.adjust_df(df_temp)
+                        query_temp.result = df_temp
+
+                        # insert into table
+                        query_temp.to_sqlite(table_name_upper, SQLiteDataImportMode.APPEND)
+
+                # single commit for all the batches
                 hamana_connection.commit()
-            else:
-                # create temporary query
-                query_temp = Query(query = query.query, columns = query.columns)
-
-                # assign result (adjust data types)
-                df_temp = DataFrame(raw_batch, columns = column_names, dtype = "object")
-                df_temp = query_temp.adjust_df(df_temp)
-                query_temp.result = df_temp
-
-                # insert into table
-                query_temp.to_sqlite(table_name_upper, SQLiteDataImportMode.APPEND)
+            except Exception:
+                hamana_connection.rollback()
+                raise
 
         logger.info(f"data inserted into table {table_name_upper}")
         hamana_cursor.close()
@@ -3,7 +3,7 @@ from typing import Any, Type, overload
 from types import TracebackType
 from abc import ABCMeta
 from pathlib import Path
-from sqlite3 import Connection, connect as sqlite_connect
+from sqlite3 import Connection
 
 from .query import Query
 from .sqlite import SQLiteConnector
@@ -42,6 +42,9 @@ class HamanaConnector(SQLiteConnector, metaclass = HamanaConnectorMeta):
         Parameters:
             path: path like string that define the SQLite database to load/create.  
                 By default the database is created in memory.
+            fast_reads: if `True`, the connection is opened with the `SQLiteConnector` 
+                fast reads PRAGMAs (memory-mapped file, larger page cache and 
+                temporary storage in memory).
 
         **Example**
         ```python
@@ -59,11 +62,12 @@ class HamanaConnector(SQLiteConnector, metaclass = HamanaConnectorMeta):
     """
 
     _connection: Connection| None = None
+    _shared_connection = True
 
-    def __init__(self, path: str | Path = ":memory:") -> None:
+    def __init__(self, path: str | Path = ":memory:", fast_reads: bool = False) -> None:
         path_str = str(path)
-        super().__init__(path_str)
-        self._connection = sqlite_connect(database = path_str)
+        super().__init__(path_str, fast_reads = fast_reads)
+        self._connection = super()._connect()
 
     def _connect(self) -> Connection:
         if self._connection is None:
@@ -126,7 +130,7 @@ class HamanaConnector(SQLiteConnector, metaclass = HamanaConnectorMeta):
         logger.debug("end")
         return
 
-def connect(path: str | Path = ":memory:") -> None:
+def connect(path: str | Path = ":memory:", fast_reads: bool = False) -> None:
     """
         Connect to the database using the path provided.  
         This function is a helper function to connect to the database 
@@ -135,11 +139,13 @@ def connect(path: str | Path = ":memory:") -> None:
         Parameters:
             path: path like string that define the SQLite database to load/create.  
                 By default the database is created in memory.
+            fast_reads: if `True`, the connection is opened with the 
+                fast reads PRAGMAs of `SQLiteConnector`.
     """
     logger.debug("start")
 
     # create connection
-    HamanaConnector(path)
+    HamanaConnector(path, fast_reads = fast_reads)
     logger.info(f"Connected to the database ({path}).")
 
     logger.debug("end")
@@ -189,7 +195,7 @@ def execute(query: Query | str) -> None | Query:
 
     # execute query
     result = HamanaConnector.get_instance().execute(query)
-    logger.info(f"Query executed successfully: {query}")
+    logger.info("Query executed successfully: %s", query)
 
     logger.debug("end")
     return result
\ No newline at end of file
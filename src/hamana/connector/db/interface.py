@@ -154,7 +154,7 @@ class DatabaseConnectorABC(metaclass = ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    def execute(self, query: Query | str) -> None | Query:
+    def execute(self, query: Query | str, fetch_size: int | None = None) -> None | Query:
         """
             Function used to extract data from the database by 
             executin a SELECT query.
@@ -163,6 +163,9 @@ class DatabaseConnectorABC(metaclass = ABCMeta):
                 query: query to execute on database. The query could be 
                     a string or a `Query` object. If the query is a string, 
                     then the function automatically creates a `Query` object.
+                fetch_size: optional number of rows fetched for each round trip 
+                    (`cursor.arraysize`). If not provided, the rows are extracted 
+                    with `fetchall` using the driver default fetch size.
 
             Returns:
                 The result depends on the input provided. 
@@ -191,7 +194,7 @@ class DatabaseConnectorABC(metaclass = ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    def to_sqlite(self, query: Query, table_name: str, raw_insert: bool = False, batch_size: int = 10_000, mode: SQLiteDataImportMode = SQLiteDataImportMode.REPLACE) -> None:
+    def to_sqlite(self, query: Query, table_name: str, raw_insert: bool = False, batch_size: int = 10_000, mode: SQLiteDataImportMode = SQLiteDataImportMode.REPLACE, bulk: bool = False) -> None:
         """
             This function is used to extract data from the database and insert it 
             into the `hamana` internal database (`HamanaConnector`).
@@ -213,7 +216,8 @@ class DatabaseConnectorABC(metaclass = ABCMeta):
 
             By default, the method performs the automatic datatype 
             conversion. However, use the parameter `raw_insert` to 
-            **avoid** this conversion and improve the INSERT efficiency. 
+            **avoid** this conversion and improve the INSERT efficiency; 
+            in this case, all the batches are inserted in a single transaction. 
 
             Parameters:
                 query: query to execute on database.
@@ -224,6 +228,9 @@ class DatabaseConnectorABC(metaclass = ABCMeta):
                     set to `False`.
                 batch_size: size of the batch used during the inserting process.
                 mode: mode of importing the data into the database.
+                bulk: if `True`, the data is loaded with `synchronous = OFF` and 
+                    in-memory journal and temporary storage on the `hamana` database; 
+                    the original settings are restored at the end of the load.
         """
         raise NotImplementedError
 
@@ -3,7 +3,7 @@ import logging
 from dataclasses import dataclass
 from typing import Any, Generator, overload
 
-from oracledb import defaults
+from oracledb import defaults, init_oracle_client
 from oracledb import Connection, ConnectParams
 from oracledb.exceptions import OperationalError
 
@@ -34,6 +34,21 @@ class OracleConnectorConfig(DatabaseConnectorConfig):
     data_source_name: str | None = None
     """DSN connection string to connect on the database."""
 
+    thick_mode: bool = False
+    """
+        Flag to enable the `oracledb` thick mode. By default, the thin 
+        mode (pure Python) is used. The thick mode relies on the Oracle 
+        Client libraries, which must be installed on the machine, and is 
+        usually faster when fetching large result sets because the fetch 
+        and type conversion loops run in C.
+    """
+
+    oracle_client_lib_dir: str | None = None
+    """
+        Directory containing the Oracle Client libraries used in thick mode. 
+        If not provided, the libraries are searched in the default system paths.
+    """
+
     @property
     def connect_params(self) -> ConnectParams:
         """Get the connection parameters to connect on the database."""
@@ -49,11 +64,40 @@ class OracleConnector(BaseConnector):
         Class representing a connector to an Oracle database.
     """
 
+    _thick_mode_enabled: bool = False
+    """Flag to indicate if the `oracledb` thick mode was already enabled in the process."""
+
     def __init__(self, config: OracleConnectorConfig, **kwargs: dict[str, Any]) -> None:
         self.config = config
         self.kwargs = kwargs
         self.connection: Connection
 
+        if config.thick_mode:
+            self.enable_thick_mode(config.oracle_client_lib_dir)
+
+    @classmethod
+    def enable_thick_mode(cls, lib_dir: str | None = None) -> None:
+        """
+            Use this function to enable the `oracledb` thick mode by loading 
+            the Oracle Client libraries. Observe that the thick mode can be 
+            enabled only once per process, and the following calls are ignored.
+
+            Parameters:
+                lib_dir: directory containing the Oracle Client libraries.
+                    If not provided, the libraries are searched in the default system paths.
+        """
+        logger.debug("start")
+
+        if cls._thick_mode_enabled:
+            logger.debug("thick mode already enabled")
+        else:
+            logger.info("enabling thick mode")
+            init_oracle_client(lib_dir = lib_dir)
+            OracleConnector._thick_mode_enabled = True
+
+        logger.debug("end")
+        return
+
     @classmethod
     def create_config(
         cls,
@@ -62,7 +106,9 @@ class OracleConnector(BaseConnector):
         host: str | None = None,
         service: str | None = None,
         port: int = 1521,
-        data_source_name: str | None = None
+        data_source_name: str | None = None,
+        thick_mode: bool = False,
+        oracle_client_lib_dir: str | None = None
     ) -> OracleConnectorConfig:
         """
             Use this function to create a new Oracle connector configuration.
@@ -75,6 +121,9 @@ class OracleConnector(BaseConnector):
                 port: Port of the database.
                 data_source_name: DSN connection string to connect on the database. 
                     Observe that if DSN is provided, then host, service and port are ignored.
+                thick_mode: flag to enable the `oracledb` thick mode.
+                oracle_client_lib_dir: directory containing the Oracle Client libraries 
+                    used in thick mode.
 
             Returns:
                 Oracle connector configuration.
@@ -88,6 +137,11 @@ class OracleConnector(BaseConnector):
             logger.debug(f"host: {host}, service: {service}, port: {port}")
             config = OracleConnectorConfig(user = user, password = password, host = host, service = service, port = port)
 
+        # set client mode
+        config.thick_mode = thick_mode
+        config.oracle_client_lib_dir = oracle_client_lib_dir
+        logger.debug("thick mode: %s", thick_mode)
+
         logger.debug("end")
         return config
 
@@ -99,7 +153,9 @@ class OracleConnector(BaseConnector):
         host: str | None = None,
         service: str | None = None,
         port: int = 1521,
-        data_source_name: str | None = None
+        data_source_name: str | None = None,
+        thick_mode: bool = False,
+        oracle_client_lib_dir: str | None = None
     ) -> "OracleConnector":
         """
             Use this function to create a new Oracle connector.
@@ -112,6 +168,9 @@ class OracleConnector(BaseConnector):
                 port: Port of the database.
                 data_source_name: DSN connection string to connect on the database. 
                     Observe that if DSN is provided, then host, service and port are ignored.
+                thick_mode: flag to enable the `oracledb` thick mode.
+                oracle_client_lib_dir: directory containing the Oracle Client libraries 
+                    used in thick mode.
 
             Returns:
                 Oracle connector.
@@ -123,7 +182,9 @@ class OracleConnector(BaseConnector):
             host = host,
             service = service,
             port = port,
-            data_source_name = data_source_name
+            data_source_name = data_source_name,
+            thick_mode = thick_mode,
+            oracle_client_lib_dir = oracle_client_lib_dir
         )
         logger.debug("end")
         return cls(config)
@@ -166,14 +227,14 @@ class OracleConnector(BaseConnector):
         return column
 
     @overload
-    def execute(self, query: str) -> Query: ...
+    def execute(self, query: str, fetch_size: int | None = None) -> Query: ...
 
     @overload
-    def execute(self, query: Query) -> None: ...
+    def execute(self, query: Query, fetch_size: int | None = None) -> None: ...
 
-    def execute(self, query: Query | str) -> None | Query:
+    def execute(self, query: Query | str, fetch_size: int | None = None) -> None | Query:
         try:
-            return super().execute(query)
+            return super().execute(query, fetch_size)
         except OperationalError as e:
             logger.exception(e)
             raise DatabaseConnetionError("unable to establish connection with database.")
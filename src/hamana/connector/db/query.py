@@ -1,13 +1,18 @@
+import os
 import logging
+from functools import lru_cache, partial
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
+from sqlite3 import Connection, SQLITE_LIMIT_VARIABLE_NUMBER
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import TypeVar, Generic
+from typing import Callable, TypeVar, Generic, Literal, Iterator
 
 from ...core.column import Column, DataType
 from .schema import SQLiteDataImportMode
-from .exceptions import QueryInitializationError, QueryResultNotAvailable, QueryColumnsNotAvailable, ColumnDataTypeConversionError
+from .exceptions import QueryInitializationError, QueryResultNotAvailable, QueryColumnsNotAvailable, ColumnDataTypeConversionError, TableAlreadyExists
 
 # set logging
 logger = logging.getLogger(__name__)
@@ -32,6 +37,194 @@ class QueryParam:
     value: ParamValue
     """Value of the parameter."""
 
+def _datetime_to_int(series: pd.Series, include_time: bool = False) -> pd.Series:
+    """
+        Convert a datetime series into an integer series with format 
+        `YYYYMMDD` (or `YYYYMMDDHHmmss` if `include_time` is set). 
+        The conversion is performed with vectorized arithmetic on the 
+        datetime components, avoiding the formatting of each value as string.
+
+        Parameters:
+            series: datetime series to convert.
+            include_time: flag to include the time component.
+
+        Returns:
+            converted series.
+    """
+    if series.dtype.kind == "M" and isinstance(series.dtype, np.dtype):
+        values = series.to_numpy()
+        if not np.isnat(values).any():
+            # share the day/month/year truncations across all the components
+            days = values.astype("datetime64[D]")
+            months = days.astype("datetime64[M]")
+            years = months.astype("datetime64[Y]")
+            result = (years.astype("int64") + 1970) * 10_000 + ((months - years).astype("int64") + 1) * 100 + (days - months).astype("int64") + 1
+            if include_time:
+                seconds = (values - days).astype("timedelta64[s]").astype("int64")
+                result = result * 1_000_000 + seconds // 3_600 * 10_000 + seconds % 3_600 // 60 * 100 + seconds % 60
+            return pd.Series(result, index = series.index, name = series.name)
+
+    # components are float when missing datetimes are present
+    dt = series.dt
+    result = dt.year.astype("float64" if series.hasnans else "int64") * 10_000 + dt.month * 100 + dt.day
+    if include_time:
+        result = result * 1_000_000 + dt.hour * 10_000 + dt.minute * 100 + dt.second
+
+    # missing datetimes are kept as nullable integers
+    if result.hasnans:
+        return result.astype("Int64")
+    return result.astype(int)
+
+def _to_sqlite_values(series: pd.Series) -> list:
+    """
+        Convert a series into a list of Python scalars that can be 
+        bound by `sqlite3`; missing values (`NaN`, `pd.NA`, `pd.NaT`) 
+        are converted to `None`.
+
+        Parameters:
+            series: series to convert.
+
+        Returns:
+            list of values.
+    """
+    if series.hasnans:
+        return series.astype(object).where(series.notna(), None).tolist()
+    return series.tolist()
+
+def _boolean_to_int(series: pd.Series) -> pd.Series:
+    """
+        Convert a boolean series into an integer series. 
+        If the series is backed by a `numpy` boolean array, then 
+        the buffer is reinterpreted as `int8` without copying it; 
+        `pyarrow` backed series are casted by `pyarrow` (null values 
+        are preserved).
+
+        Parameters:
+            series: boolean series to convert.
+
+        Returns:
+            converted series.
+    """
+    if series.dtype == np.bool_:
+        return pd.Series(series.to_numpy().view(np.int8), index = series.index, name = series.name, copy = False)
+    if isinstance(series.dtype, pd.ArrowDtype):
+        return series.astype("int8[pyarrow]")
+    return series.astype(int)
+
+# conversions of the datatypes not supported by SQLite
+_SQLITE_CONVERTERS: dict[DataType, Callable[[pd.Series], pd.Series]] = {
+    DataType.BOOLEAN: _boolean_to_int,
+    DataType.DATE: _datetime_to_int,
+    DataType.DATETIME: partial(_datetime_to_int, include_time = True)
+}
+
+# PRAGMAs used for bulk loads into SQLite
+_SQLITE_BULK_PRAGMAS = {
+    "synchronous": "OFF",
+    "journal_mode": "MEMORY",
+    "temp_store": "MEMORY"
+}
+
+@contextmanager
+def sqlite_bulk_pragmas(connection: Connection) -> Iterator[None]:
+    """
+        Context manager used to set the SQLite PRAGMAs for bulk 
+        loads (no `fsync`, in-memory journal and temporary storage). 
+        The original values are restored on exit.
+
+        The PRAGMAs cannot be changed within a pending transaction; 
+        for this reason, if a transaction is already open on entry, 
+        the PRAGMAs are not applied and the transaction is left untouched. 
+        Otherwise, in case of error, the transaction started inside the 
+        context is rolled back before restoring the PRAGMAs.
+
+        Parameters:
+            connection: SQLite connection.
+    """
+    if connection.in_transaction:
+        logger.warning("transaction in progress, bulk pragmas not applied")
+        yield
+        return
+
+    pragmas_original = {name: connection.execute(f"PRAGMA {name}").fetchone()[0] for name in _SQLITE_BULK_PRAGMAS}
+    logger.debug("original pragmas: %s", pragmas_original)
+    try:
+        for name, value in _SQLITE_BULK_PRAGMAS.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+        yield
+    finally:
+        if connection.in_transaction:
+            connection.rollback()
+        for name, value in pragmas_original.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+        logger.debug("original pragmas restored")
+
+@lru_cache(maxsize = 128)
+def _load_sql(path: str, mtime_ns: int, size: int) -> str:
+    """
+        Read the content of a SQL file. The result is cached, 
+        and the file modification time and size are part of the 
+        key so that the cache is invalidated when the file changes.
+
+        Parameters:
+            path: path of the SQL file.
+            mtime_ns: modification time of the file (nanoseconds).
+            size: size of the file (bytes).
+
+        Returns:
+            content of the file.
+    """
+    with open(path, "r") as f:
+        return f.read()
+
+def _is_sql_file(query: str) -> bool:
+    """
+        Check if a string is the path of an existing file. The 
+        filesystem is accessed only if the string looks like a path, 
+        so inline SQL queries do not require any system call.
+    """
+    if len(query) >= 4096 or "\n" in query:
+        return False
+    if not ("/" in query or "\\" in query or query.endswith(".sql")):
+        return False
+    return os.path.isfile(query)
+
+def _read_sql_file(path: Path) -> str:
+    """Read a SQL file through the `_load_sql` cache."""
+    st = path.stat()
+    return _load_sql(str(path), st.st_mtime_ns, st.st_size)
+
+@lru_cache(maxsize = 256)
+def _build_insert_sql(columns_key: tuple[str, ...], table_name: str) -> str:
+    """
+        Build the query to insert data into a table.
+
+        Parameters:
+            columns_key: names of the columns.
+            table_name: name of the table.
+
+        Returns:
+            insert query.
+    """
+    columns = ", ".join(columns_key)
+    values = ", ".join(["?" for _ in columns_key])
+    return f"INSERT INTO {table_name} ({columns}) VALUES ({values})"
+
+@lru_cache(maxsize = 256)
+def _build_create_sql(columns_key: tuple[tuple[str, DataType], ...], table_name: str) -> str:
+    """
+        Build the query to create a table.
+
+        Parameters:
+            columns_key: names and datatypes of the columns.
+            table_name: name of the table.
+
+        Returns:
+            create query.
+    """
+    body = "\n  , ".join(f"{name} {DataType.to_sqlite(dtype)}" for name, dtype in columns_key)
+    return f"CREATE TABLE {table_name} (\n    {body}\n)"
+
 class Query(Generic[TColumn]):
     """
         Class to represent a query object.
@@ -46,17 +239,16 @@ class Query(Generic[TColumn]):
 
         # setup query
         if isinstance(query, Path):
-            logger.info(f"loading query from file: {query}")
+            logger.info("loading query from file: %s", query)
 
             if not query.exists():
                 raise QueryInitializationError(f"file {query} not found")
 
-            self.query = query.read_text()
+            self.query = _read_sql_file(query)
         elif isinstance(query, str):
-            if Path(query).exists():
-                logger.info(f"loading query from file: {query}")
-                with open(query, "r") as f:
-                    self.query = f.read()
+            if _is_sql_file(query):
+                logger.info("loading query from file: %s", query)
+                self.query = _read_sql_file(Path(query))
             else:
                 self.query = query
 
@@ -69,12 +261,6 @@ class Query(Generic[TColumn]):
         SQL query as a string or to load it from a file by providing the file path.
     """
 
-    params: list[QueryParam] | dict[str, ParamValue] | None = None
-    """
-        List of parameters used in the query. 
-        The parameters are replaced by their values when the query is executed.
-    """
-
     columns: list[TColumn] | None = None
     """
         Definition of the columns returned by the query. 
@@ -106,18 +292,45 @@ class Query(Generic[TColumn]):
         self._result = value
         self.flag_executed = True
 
+    @property
+    def params(self) -> list[QueryParam] | dict[str, ParamValue] | None:
+        """
+            List of parameters used in the query. 
+            The parameters are replaced by their values when the query is executed.
+        """
+        return self._params
+
+    @params.setter
+    def params(self, value: list[QueryParam] | dict[str, ParamValue] | None) -> None:
+        self._params = value
+
+        # invalidate cached parameters
+        self._params_dict: dict[str, ParamValue] | None = None
+
     def get_params(self) -> dict[str, ParamValue] | None:
         """
             Returns the query parameters as a dictionary.
             Returns `None` if there are no parameters.
+
+            When `params` is a list, the dictionary is built once and 
+            cached until `params` is reassigned; observe that in-place 
+            changes of the list are **not** detected.
         """
-        if isinstance(self.params, list):
-            _params = {param.name : param.value for param in self.params}
-        else:
-            _params = self.params
-        return _params
+        if not isinstance(self.params, list):
+            return self.params
 
-    def to_sqlite(self, table_name: str, mode: SQLiteDataImportMode = SQLiteDataImportMode.REPLACE) -> None:
+        if self._params_dict is None:
+            self._params_dict = {param.name : param.value for param in self.params}
+        return self._params_dict
+
+    def to_sqlite(
+        self,
+        table_name: str,
+        mode: SQLiteDataImportMode = SQLiteDataImportMode.REPLACE,
+        chunksize: int = 10_000,
+        method: Literal["multi", "executemany"] | None = "multi",
+        bulk: bool = False
+    ) -> None:
         """
             This function is used to insert the query result into a 
             table hosted on the `hamana` internal database (`HamanaConnector`).
@@ -135,29 +348,46 @@ class Query(Generic[TColumn]):
                 converted to an int number using the following format: `YYYYMMDDHHmmss`
                 for `dateitme`, `YYYYMMDD` for `date`.
 
+            The rows are inserted in batches of `chunksize` rows. By default, 
+            each batch is inserted with a single multi-row `INSERT` statement 
+            (`method = "multi"`); in this case, the `chunksize` is reduced if 
+            needed to respect the maximum number of variables admitted by SQLite 
+            in a single statement.
+
             Parameters:
                 table_name: name of the table to create into the database.
                     By assumption, the table's name is converted to uppercase.
                 mode: mode of importing the data into the database.
+                chunksize: number of rows inserted in each batch.
+                method: insertion method used by `pandas.DataFrame.to_sql`; 
+                    use `None` to insert the rows with one `INSERT` per row.
+                    Use `"executemany"` to bypass `pandas` and insert all the rows 
+                    with `sqlite3.Cursor.executemany` in a single transaction 
+                    (requires `columns`); in this case `chunksize` is ignored.
+                bulk: if `True`, the data is loaded with `synchronous = OFF` and 
+                    in-memory journal and temporary storage; the original 
+                    settings are restored at the end of the load. Observe that 
+                    a crash during the load may corrupt the database.
         """
         logger.debug("start")
-        df_insert = self.result.copy()
+        df_insert = self.result
 
         # set dtype
         columns_dtypes: dict | None = None
+        columns_converted: dict[str, pd.Series] = {}
         if self.columns is not None:
-            columns_dtypes = {}
+            columns_dtypes = {column.name: DataType.to_sqlite(column.dtype) for column in self.columns}
             for column in self.columns:
-                columns_dtypes[column.name] = DataType.to_sqlite(column.dtype)
-
                 # convert columns
-                match column.dtype:
-                    case DataType.BOOLEAN:
-                        df_insert[column.name] = df_insert[column.name].astype(int)
-                    case DataType.DATE:
-                        df_insert[column.name] = df_insert[column.name].dt.strftime("%Y%m%d").astype(int)
-                    case DataType.DATETIME:
-                        df_insert[column.name] = df_insert[column.name].dt.strftime("%Y%m%d%H%M%S").astype(int)
+                converter = _SQLITE_CONVERTERS.get(column.dtype)
+                if converter is not None:
+                    columns_converted[column.name] = converter(df_insert[column.name])
+
+        # replace only converted columns (shallow copy, original blocks are shared)
+        if columns_converted:
+            df_insert = df_insert.copy(deep = False)
+            for column_name, series in columns_converted.items():
+                df_insert[column_name] = series
 
         # import internal database
         from .hamana import HamanaConnector
@@ -169,24 +399,87 @@ class Query(Generic[TColumn]):
         table_name_upper = table_name.upper()
         try:
             with db:
-                logger.debug(f"inserting data into table {table_name_upper}")
-                logger.debug(f"mode: {mode.value}")
-                df_insert.to_sql(
-                    name = table_name_upper,
-                    con = db.connection,
-                    if_exists = mode.value,
-                    dtype = columns_dtypes,
-                    index = False
-                )
-                logger.info(f"data inserted into table {table_name_upper}")
+                logger.debug("inserting data into table %s", table_name_upper)
+                logger.debug("mode: %s", mode.value)
+
+                # limit batch to max number of variables
+                if method == "multi":
+                    max_variables = db.connection.getlimit(SQLITE_LIMIT_VARIABLE_NUMBER)
+                    chunksize = max(1, min(chunksize, max_variables // max(1, df_insert.shape[1])))
+                logger.debug("chunksize: %s", chunksize)
+
+                with sqlite_bulk_pragmas(db.connection) if bulk else nullcontext():
+                    if method == "executemany":
+                        self._insert_executemany(db.connection, table_name_upper, df_insert, mode)
+                    else:
+                        df_insert.to_sql(
+                            name = table_name_upper,
+                            con = db.connection,
+                            if_exists = mode.value,
+                            dtype = columns_dtypes,
+                            index = False,
+                            chunksize = chunksize,
+                            method = method
+                        )
+                logger.info("data inserted into table %s", table_name_upper)
         except Exception as e:
-            logger.error(f"error inserting data into table {table_name_upper}")
+            logger.error("error inserting data into table %s", table_name_upper)
             logger.exception(e)
             raise e
 
         logger.debug("end")
         return
 
+    def _insert_executemany(self, connection: Connection, table_name: str, df: pd.DataFrame, mode: SQLiteDataImportMode) -> None:
+        """
+            Insert a `pandas.DataFrame` into a SQLite table with a single 
+            `executemany` call. The creation of the table and the insert 
+            are performed in one transaction.
+
+            Parameters:
+                connection: SQLite connection.
+                table_name: name of the table (already uppercase).
+                df: DataFrame to insert, with SQLite compatible columns.
+                mode: mode of importing the data into the database.
+
+            Raises:
+                QueryColumnsNotAvailable: if no columns are available.
+                TableAlreadyExists: if the table already exists and `mode` is `FAIL`.
+        """
+        logger.debug("start")
+
+        # build queries (check columns availability)
+        query_create = self.get_create_query(table_name)
+        query_insert = self.get_insert_query(table_name)
+        columns = [column.name for column in self.columns] # type: ignore (checked by get_create_query)
+
+        table_exists = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)
+        ).fetchone() is not None
+        if table_exists and mode == SQLiteDataImportMode.FAIL:
+            logger.error("table %s already exists", table_name)
+            raise TableAlreadyExists(table_name)
+
+        connection.execute("BEGIN")
+        try:
+            if table_exists and mode == SQLiteDataImportMode.REPLACE:
+                connection.execute(f"DROP TABLE {table_name}")
+                logger.debug("table %s dropped", table_name)
+
+            if not table_exists or mode == SQLiteDataImportMode.REPLACE:
+                connection.execute(query_create)
+                logger.debug("table %s created", table_name)
+
+            # rows built from per-column lists of Python scalars
+            connection.executemany(query_insert, zip(*(_to_sqlite_values(df[column]) for column in columns)))
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+
+        logger.debug("end")
+        return
+
     def get_insert_query(self, table_name: str) -> str:
         """
             This function returns a query to insert the query result into a table.
@@ -205,19 +498,11 @@ class Query(Generic[TColumn]):
             logger.error("no columns available")
             raise QueryColumnsNotAvailable("no columns available")
 
-        # get columns
-        columns = ", ".join([column.name for column in self.columns])
-        logger.debug("columns string created")
-
-        # get values
-        values = ", ".join(["?" for _ in self.columns])
-        logger.debug("values string created")
-
         # build query
         table_name_upper = table_name.upper()
-        query = f"INSERT INTO {table_name_upper} ({columns}) VALUES ({values})"
-        logger.info(f"query to insert data into table {table_name_upper} created")
-        logger.info(f"query: {query}")
+        query = _build_insert_sql(tuple(column.name for column in self.columns), table_name_upper)
+        logger.info("query to insert data into table %s created", table_name_upper)
+        logger.info("query: %s", query)
 
         logger.debug("end")
         return query
@@ -242,11 +527,9 @@ class Query(Generic[TColumn]):
 
         # build query
         table_name_upper = table_name.upper()
-        query = "CREATE TABLE " + table_name_upper + " (\n" + \
-                "".rjust(4) + ", ".rjust(4).join([f"{column.name} {DataType.to_sqlite(column.dtype)}\n" for column in self.columns]) + \
-                ")"
-        logger.info(f"query to create table {table_name_upper} created")
-        logger.info(f"query: {query}")
+        query = _build_create_sql(tuple((column.name, column.dtype) for column in self.columns), table_name_upper)
+        logger.info("query to create table %s created", table_name_upper)
+        logger.info("query: %s", query)
 
         logger.debug("end")
         return query
@@ -294,51 +577,55 @@ class Query(Generic[TColumn]):
         columns = self.columns
 
         # get columns
-        columns_query = []
-        columns_df = df.columns.to_list()
-
         logger.info("get query columns ordered")
-        for col in sorted(columns, key = lambda col: col.order if col.order is not None else 0):
-            columns_query.append(col.name)
+        columns_query = pd.Index([col.name for col in sorted(columns, key = lambda col: col.order if col.order is not None else 0)])
 
-        # check columns_query is a subset of columns_df
-        if not set(columns_query).issubset(columns_df):
+        # check columns_query is a subset of df columns
+        columns_found = columns_query.isin(df.columns)
+        if not columns_found.all():
             logger.error("columns do not match between query and resuls")
-            raise QueryColumnsNotAvailable(f"columns do not match {set(columns_query).difference(columns_df)}")
+            raise QueryColumnsNotAvailable(f"columns do not match {set(columns_query[~columns_found])}")
 
         # re-order
-        if columns_query != columns_df:
+        if not df.columns.equals(columns_query):
             logger.info("re-ordering columns")
-            logger.info(f"order > {columns_query}")
-            df = df.copy()[columns_query]
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("order > %s", columns_query.to_list())
+            df = df.reindex(columns = columns_query)
         else:
             logger.info("columns already in the correct order")
 
         # check data types
         logger.info("check data types")
-        dtypes_df = df.dtypes
+        dtypes_df = dict(zip(df.columns, df.dtypes))
+        columns_mismatch = []
         for column in columns:
-
-            dtype_query = column.dtype
-            dtype_df = DataType.from_pandas(dtypes_df[column.name].name)
-            logger.debug(f"column: {column.name}")
-            logger.debug(f"datatype (query): {dtype_query}")
-            logger.debug(f"datatype (df): {dtype_df}")
-
-            if dtype_query != dtype_df:
-                try:
-                    logger.info(f"different datatype for '{column.name}' column -> (query) {dtype_query} != (df) {dtype_df}")
-
-                    if column.parser is None:
-                        logger.warning(f"no parser available for {column.name} (order: {column.order})")
-                        logger.warning("skip column")
-                        continue
-
-                    df[column.name] = column.parser.pandas(df[column.name])
-                except Exception as e:
-                    logger.error("ERROR: on datatype change")
-                    logger.error(e)
-                    raise ColumnDataTypeConversionError(f"ERROR: on datatype change for {column.name} (order: {column.order})")
+            dtype_df = DataType.from_pandas(dtypes_df[column.name])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("column: %s", column.name)
+                logger.debug("datatype (query): %s", column.dtype)
+                logger.debug("datatype (df): %s", dtype_df)
+
+            if column.dtype != dtype_df:
+                logger.info("different datatype for '%s' column -> (query) %s != (df) %s", column.name, column.dtype, dtype_df)
+                columns_mismatch.append(column)
+
+        if not columns_mismatch:
+            logger.info("data types already matching")
+
+        # convert only mismatching columns
+        for column in columns_mismatch:
+            try:
+                if column.parser is None:
+                    logger.warning("no parser available for %s (order: %s)", column.name, column.order)
+                    logger.warning("skip column")
+                    continue
+
+                df[column.name] = column.parser.pandas(df[column.name])
+            except Exception as e:
+                logger.error("ERROR: on datatype change")
+                logger.error(e)
+                raise ColumnDataTypeConversionError(f"ERROR: on datatype change for {column.name} (order: {column.order})")
 
         logger.debug("end")
         return df
@@ -9,18 +9,37 @@ from .exceptions import ColumnDataTypeConversionError
 # set logger
 logger = logging.getLogger(__name__)
 
+# PRAGMAs used to speed up large reads
+_SQLITE_FAST_READS_PRAGMAS = {
+    "temp_store": "MEMORY",
+    "mmap_size": 1_073_741_824,
+    "cache_size": -65_536
+}
+
 class SQLiteConnector(BaseConnector):
     """
         Class representing a connector to a SQLite database.
+
+        Parameters:
+            path: path of the SQLite database.
+            fast_reads: if `True`, each connection is opened with the database 
+                file memory-mapped (up to 1 GiB), a 64 MiB page cache and 
+                temporary storage in memory; useful for large extractions.
     """
 
-    def __init__(self, path: str, **kwargs: dict[str, Any]) -> None:
+    def __init__(self, path: str, fast_reads: bool = False, **kwargs: dict[str, Any]) -> None:
         self.path = path
+        self.fast_reads = fast_reads
         self.kwargs = kwargs
         self.connection: Connection
 
     def _connect(self) -> Connection:
-        return Connection(self.path)
+        connection = Connection(self.path)
+        if self.fast_reads:
+            for name, value in _SQLITE_FAST_READS_PRAGMAS.items():
+                connection.execute(f"PRAGMA {name} = {value}")
+            logger.debug("fast reads pragmas set")
+        return connection
 
     def get_column_from_dtype(self, dtype: Any, column_name: str, order: int) -> Column:
         # SQLite connector does not provide datatypes
@@ -1,7 +1,10 @@
 import logging
 import decimal
+import time
 import datetime
-from typing import Any
+from queue import LifoQueue, Empty, Full
+from types import TracebackType
+from typing import Any, Callable, Type
 
 from teradatasql import TeradataConnection as Connection
 
@@ -12,6 +15,18 @@ from ...core.column import Column, NumberColumn, IntegerColumn, StringColumn, Da
 # set logger
 logger = logging.getLogger(__name__)
 
+# mapping between Python types returned by teradatasql and columns
+_DTYPE_TO_COLUMN: dict[type, Callable[..., Column]] = {
+    int: IntegerColumn,
+    bytes: IntegerColumn,
+    float: NumberColumn,
+    decimal.Decimal: NumberColumn,
+    str: StringColumn,
+    datetime.date: DateColumn,
+    datetime.datetime: DatetimeColumn,
+    datetime.time: DatetimeColumn
+}
+
 class TeradataConnector(BaseConnector):
     """
         Class representing a connector to a Teradata database.
@@ -25,6 +40,8 @@ class TeradataConnector(BaseConnector):
         database: str | None = None,
         port: int = 1025,
         logmech: str = "LDAP",
+        pool_size: int = 0,
+        pool_idle_timeout: float = 600,
         **kwargs: Any
     ) -> None:
         """
@@ -41,6 +58,12 @@ class TeradataConnector(BaseConnector):
                 database: name of the database to connect to.
                 port: port of the Teradata database. Default is 1025.
                 logmech: logon mechanism to use for the connection. Default is "LDAP".
+                pool_size: maximum number of idle connections kept open and reused 
+                    across queries, saving the logon handshake on each query. 
+                    Default is 0, i.e. no pooling. When pooling is enabled, 
+                    call `close_pool()` on shutdown to close the idle connections.
+                pool_idle_timeout: seconds after which an idle pooled connection 
+                    is closed instead of reused. Default is 600.
                 **kwargs: additional keyword arguments to pass to the Teradata connection.
         """
         logger.debug("start")
@@ -59,6 +82,11 @@ class TeradataConnector(BaseConnector):
         # connection
         self.connection: Connection
 
+        # pool of idle connections (with the time they were returned)
+        self.pool_size = pool_size
+        self.pool_idle_timeout = pool_idle_timeout
+        self._pool: LifoQueue[tuple[Connection, float]] = LifoQueue(maxsize = max(pool_size, 0))
+
         logger.debug("end")
         return
 
@@ -69,13 +97,16 @@ class TeradataConnector(BaseConnector):
         """
         logger.debug("start")
 
-        config_dict = {}
         # set common parameters
-        for param in ["user", "password", "host", "database", "port", "logmech"]:
-            value = getattr(self, param)
-            if value is not None:
-                _param = "dbs_port" if param == "port" else param
-                config_dict[_param] = value
+        config_dict = {
+            "user": self.user,
+            "password": self.password,
+            "host": self.host,
+            "database": self.database,
+            "dbs_port": self.port,
+            "logmech": self.logmech
+        }
+        config_dict = {param: value for param, value in config_dict.items() if value is not None}
 
         # add additional parameters
         config_dict.update(self.kwargs)
@@ -84,24 +115,88 @@ class TeradataConnector(BaseConnector):
         return config_dict
 
     def _connect(self) -> Connection: # type: ignore [teradatasql supports PEP-249]
+        # reuse an idle connection, discarding the expired or dropped ones
+        while self.pool_size > 0:
+            try:
+                connection, returned_at = self._pool.get_nowait()
+            except Empty:
+                break
+
+            if time.monotonic() - returned_at > self.pool_idle_timeout:
+                logger.info("pooled connection expired")
+            elif self._is_alive(connection):
+                logger.info("connection taken from pool")
+                return connection
+            else:
+                logger.warning("pooled connection not alive")
+            self._close_quietly(connection)
+
         return Connection(**self._get_connection_params())
 
+    def __exit__(self, exc_type: Type[BaseException] | None, exc_value: BaseException | None, exc_traceback: TracebackType | None) -> None:
+        # connections are returned to the pool only if no
+        # error occurred, otherwise they could be in a broken state
+        if self.pool_size > 0 and exc_type is None:
+            try:
+                self._pool.put_nowait((self.connection, time.monotonic()))
+                logger.info("connection returned to pool")
+                return
+            except Full:
+                logger.info("pool full, connection closed")
+        return super().__exit__(exc_type, exc_value, exc_traceback)
+
+    @staticmethod
+    def _is_alive(connection: Connection) -> bool:
+        """
+            Check that a pooled connection is still usable with a cheap query.
+        """
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.debug("connection check failed: %s", e)
+            return False
+        return True
+
+    @staticmethod
+    def _close_quietly(connection: Connection) -> None:
+        """
+            Close a connection ignoring the errors (e.g. already dropped by the server).
+        """
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug("error closing connection: %s", e)
+
+    def close_pool(self) -> None:
+        """
+            Close all the idle connections kept in the pool.  
+            Use this method at the end of the process when 
+            the connector is created with `pool_size > 0`.
+        """
+        logger.debug("start")
+
+        while True:
+            try:
+                connection, _ = self._pool.get_nowait()
+            except Empty:
+                break
+            self._close_quietly(connection)
+
+        logger.info("pool closed")
+        logger.debug("end")
+        return
+
     def get_column_from_dtype(self, dtype: Any, column_name: str, order: int) -> Column:
         logger.debug("start")
 
-        column = None
-        if dtype is int or dtype is bytes:
-            column = IntegerColumn(name = column_name, order = order)
-        elif dtype is float or dtype is decimal.Decimal:
-            column = NumberColumn(name = column_name, order = order)
-        elif dtype is str:
-            column = StringColumn(name = column_name, order = order)
-        elif dtype is datetime.date:
-            column = DateColumn(name = column_name, order = order)
-        elif dtype is datetime.datetime or dtype is datetime.time:
-            column = DatetimeColumn(name = column_name, order = order)
-        else:
+        column_class = _DTYPE_TO_COLUMN.get(dtype)
+        if column_class is None:
             raise ColumnDataTypeConversionError(f"Data type {dtype} does not have a corresponding mapping.")
+        column = column_class(name = column_name, order = order)
 
         logger.debug("end")
         return column
\ No newline at end of file
@@ -1,3 +1,4 @@
+import re
 import logging
 from enum import Enum
 from dateutil import parser
@@ -9,6 +10,7 @@ from collections.abc import Callable
 import numpy as np
 import pandas as pd
 from pandas.errors import OutOfBoundsDatetime
+from pandas.api.extensions import ExtensionDtype
 from pandas.core.series import Series as PandasSeries
 
 from .exceptions import ColumnParserPandasDatetimeError, ColumnParserPandasNumberError, ColumnDateFormatterError
@@ -65,10 +67,14 @@ class DataType(Enum):
     """Custom data type."""
 
     @classmethod
-    def from_pandas(cls, dtype: str) -> "DataType":
+    def from_pandas(cls, dtype: str | np.dtype | ExtensionDtype) -> "DataType":
         """
             Function to map a `pandas` datatype to `DataType`.
 
+            The datatype can be provided as a string (e.g. `"int64"`) 
+            or as a `numpy`/`pandas` dtype object; in the latter case 
+            the mapping is performed directly on the dtype `kind`.
+
             Observe that if no mapping is found, the default is `DataType.STRING`.
 
             Parameters:
@@ -77,6 +83,18 @@ class DataType(Enum):
             Returns:
                 `DataType` mapped.
         """
+        if not isinstance(dtype, str):
+            _dtype = _PANDAS_KIND_MAP.get(dtype.kind)
+            if _dtype is None:
+                logger.warning(f"unknown data type: {dtype}")
+                return DataType.STRING
+            return _dtype
+
+        # most common names
+        _dtype = _PANDAS_NAME_MAP.get(dtype)
+        if _dtype is not None:
+            return _dtype
+
         if "int" in dtype:
             return DataType.INTEGER
         elif "float" in dtype:
@@ -102,23 +120,38 @@ class DataType(Enum):
             Returns:
                 SQLite data type mapped.
         """
-        match dtype:
-            case DataType.INTEGER:
-                return "INTEGER"
-            case DataType.NUMBER:
-                return "REAL"
-            case DataType.STRING:
-                return "TEXT"
-            case DataType.BOOLEAN:
-                return "INTEGER"
-            case DataType.DATETIME:
-                return "INTEGER"
-            case DataType.DATE:
-                return "INTEGER"
-            case DataType.CUSTOM:
-                return "BLOB"
-            case _:
-                return ""
+        return _SQLITE_MAP.get(dtype, "")
+
+_SQLITE_MAP: dict[DataType, str] = {
+    DataType.INTEGER: "INTEGER",
+    DataType.NUMBER: "REAL",
+    DataType.STRING: "TEXT",
+    DataType.BOOLEAN: "INTEGER",
+    DataType.DATETIME: "INTEGER",
+    DataType.DATE: "INTEGER",
+    DataType.CUSTOM: "BLOB"
+}
+"""Mapping between `DataType` and SQLite datatypes."""
+
+_PANDAS_NAME_MAP: dict[str, DataType] = {
+    "int64": DataType.INTEGER,
+    "float64": DataType.NUMBER,
+    "object": DataType.STRING,
+    "bool": DataType.BOOLEAN,
+    "datetime64[ns]": DataType.DATETIME
+}
+"""Mapping between the most common `pandas` datatype names and `DataType`."""
+
+_PANDAS_KIND_MAP: dict[str, DataType] = {
+    "i": DataType.INTEGER,
+    "u": DataType.INTEGER,
+    "f": DataType.NUMBER,
+    "O": DataType.STRING,
+    "U": DataType.STRING,
+    "b": DataType.BOOLEAN,
+    "M": DataType.DATETIME
+}
+"""Mapping between `numpy` dtype kinds and `DataType`."""
 
 class PandasParser(Protocol):
     """
@@ -136,7 +169,7 @@ class PandasParser(Protocol):
     def __call__(self, series: PandasSeries, *args: Any, **kwargs: Any) -> PandasSeries:
         ...
 
-@dataclass
+@dataclass(slots = True)
 class ColumnParser:
     """
         Class representing a parser for a column in the `hamana` library.
@@ -148,7 +181,7 @@ class ColumnParser:
     pandas: PandasParser
     polars: Callable | None = None
 
-@dataclass
+@dataclass(slots = True)
 class Column:
     """
         Class representing a column in the `hamana` library.
@@ -179,7 +212,7 @@ class Column:
 
     def __eq__(self, value: object) -> bool:
         if isinstance(value, Column):
-            return (self.order, self.name, self.dtype) == (value.order, value.name, value.dtype)
+            return self.order == value.order and self.name == value.name and self.dtype is value.dtype
         return NotImplemented
 
 class NumberColumn(Column):
@@ -195,11 +228,16 @@ class NumberColumn(Column):
             By default, the thousands separator is set to `,`.
         - `null_default_value`: the default value to be used when a null value is found.
             By default, the default value is set to `None`.
+        - `downcast`: flag to downcast the parsed values to the smallest numeric 
+            type able to represent them (e.g. `float32`). By default, the flag is 
+            set to `False`.
 
         The class also provides a default parser that could be used to parse 
         the number column using `pandas`.
     """
 
+    __slots__ = ("decimal_separator", "thousands_separator", "null_default_value", "downcast")
+
     decimal_separator: str
     """Decimal separator used in the number."""
 
@@ -209,6 +247,9 @@ class NumberColumn(Column):
     null_default_value: int | float | None
     """Default value to be used when a null value is found."""
 
+    downcast: bool
+    """Flag to downcast the parsed values to the smallest numeric type."""
+
     def __init__(
         self,
         name: str,
@@ -216,17 +257,20 @@ class NumberColumn(Column):
         thousands_separator: str = ",",
         null_default_value: int | float | None = None,
         parser: ColumnParser | None = None,
-        order: int | None = None
+        order: int | None = None,
+        downcast: bool = False
     ):
         # set the attributes
         self.decimal_separator = decimal_separator
         self.thousands_separator = thousands_separator
         self.null_default_value = null_default_value
+        self.downcast = downcast
         self.parser: ColumnParser # type: ignore
 
         logger.debug(f"decimal separator: {self.decimal_separator}")
         logger.debug(f"thousands separator: {self.thousands_separator}")
         logger.debug(f"null default value: {self.null_default_value}")
+        logger.debug(f"downcast: {self.downcast}")
 
         # set default parser
         if parser is None:
@@ -238,6 +282,25 @@ class NumberColumn(Column):
 
         return
 
+    def _normalize_separators(self, series: PandasSeries) -> PandasSeries:
+        """
+            Remove the thousands separator and replace the decimal 
+            separator with `.` on a string series. The decimal replacement 
+            is skipped when the separator is already `.`.
+        """
+        series = series.str.replace(self.thousands_separator, "", regex = False)
+        if self.decimal_separator != ".":
+            series = series.str.replace(self.decimal_separator, ".", regex = False)
+        return series
+
+    @staticmethod
+    def _is_numeric(series: PandasSeries) -> bool:
+        """
+            Check if the series has already a numeric (not boolean)
+            dtype, so that the string parsing can be skipped.
+        """
+        return pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+
     def pandas_default_parser(self, series: PandasSeries, mode: PandasParsingModes = PandasParsingModes.RAISE) -> PandasSeries:
         """
             Default `pandas` parser for the number columns. The function 
@@ -247,7 +310,8 @@ class NumberColumn(Column):
             column to a numeric type using the `pandas.to_numeric`.
 
             If the `null_default_value` is set, the function fills the 
-            null values with the default value.
+            null values with the default value. If `downcast` is set, 
+            the result is downcasted to the smallest float type.
 
             Parameters:
                 series: `pandas` series to be parsed.
@@ -261,17 +325,24 @@ class NumberColumn(Column):
                 `ColumnParserPandasNumberError`: error parsing the number column.
         """
 
-        _series = pd.Series(np.nan, index = series.index)
-        try:
-            _series_number = pd.to_numeric(series.dropna().astype("str").str.replace(self.thousands_separator, "").str.replace(self.decimal_separator, "."), errors = mode.value) # type: ignore (pandas issue in typing)
-            _series.loc[_series_number.index] = _series_number
-        except Exception as e:
-            logger.error(f"error parsing number: {e}")
-            raise ColumnParserPandasNumberError(f"error parsing number: {e}")
+        if self._is_numeric(series):
+            logger.debug("numeric series, skip string parsing")
+            _series = series.astype("float")
+        else:
+            _series = pd.Series(np.nan, index = series.index)
+            try:
+                _series_number = pd.to_numeric(self._normalize_separators(series.dropna().astype("str")), errors = mode.value) # type: ignore (pandas issue in typing)
+                _series.loc[_series_number.index] = _series_number
+            except Exception as e:
+                logger.error(f"error parsing number: {e}")
+                raise ColumnParserPandasNumberError(f"error parsing number: {e}")
 
         if self.null_default_value is not None:
             logger.debug(f"fill nulls, default value: {self.null_default_value}")
             _series = _series.fillna(self.null_default_value)
+
+        if self.downcast:
+            return pd.to_numeric(_series.astype("float"), downcast = "float")
         return _series.astype("float")
 
 class IntegerColumn(NumberColumn):
@@ -290,8 +361,13 @@ class IntegerColumn(NumberColumn):
             By default, the thousands separator is set to `,`.
         - `null_default_value`: the default value to be used when a null value is found.
             By default, the default value is set to `0`.
+        - `downcast`: flag to downcast the parsed values to the smallest integer 
+            type able to represent them (e.g. `int8`). By default, the flag is 
+            set to `False`.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -299,11 +375,12 @@ class IntegerColumn(NumberColumn):
         thousands_separator: str = ",",
         null_default_value: int | None = 0,
         parser: ColumnParser | None = None,
-        order: int | None = None
+        order: int | None = None,
+        downcast: bool = False
     ):
 
         # call the parent class constructor
-        super().__init__(name, decimal_separator, thousands_separator, null_default_value, parser, order)
+        super().__init__(name, decimal_separator, thousands_separator, null_default_value, parser, order, downcast)
 
         # override types
         self.dtype = DataType.INTEGER
@@ -320,7 +397,8 @@ class IntegerColumn(NumberColumn):
             If the `null_default_value` is set, the function fills the
             null values with the default value, and casts the column to 
             integer type. Otherwise, the function applies the `np.floor`
-            function to the returned series.
+            function to the returned series. If `downcast` is set, the 
+            result is downcasted to the smallest integer type.
 
             Parameters:
                 series: `pandas` series to be parsed.
@@ -334,37 +412,67 @@ class IntegerColumn(NumberColumn):
                 `ColumnParserPandasNumberError`: error parsing the number column.
         """
 
-        _series = pd.Series(np.nan, index = series.index)
-        try:
-            _series_number = pd.to_numeric(
-                arg = series.dropna().astype("str").str.replace(self.thousands_separator, "").str.replace(self.decimal_separator, "."),
-                errors = mode.value # type: ignore (pandas issue in typing)
-            )
-            _series.loc[_series_number.index] = _series_number
-        except Exception as e:
-            logger.error(f"error parsing integer: {e}")
-            raise ColumnParserPandasNumberError(f"error parsing integer: {e}")
+        if self._is_numeric(series):
+            logger.debug("numeric series, skip string parsing")
+            _series = series.astype("float")
+        else:
+            _series = pd.Series(np.nan, index = series.index)
+            try:
+                _series_number = pd.to_numeric(
+                    arg = self._normalize_separators(series.dropna().astype("str")),
+                    errors = mode.value # type: ignore (pandas issue in typing)
+                )
+                _series.loc[_series_number.index] = _series_number
+            except Exception as e:
+                logger.error(f"error parsing integer: {e}")
+                raise ColumnParserPandasNumberError(f"error parsing integer: {e}")
 
         if self.null_default_value is not None:
             logger.debug(f"fill nulls, default value: {self.null_default_value}")
-            return pd.Series(_series, dtype = "float").fillna(self.null_default_value).astype("int")
+            _series = pd.Series(_series, dtype = "float").fillna(self.null_default_value).astype("int")
+        else:
+            _series = pd.Series(np.floor(_series.astype(float)), dtype = "Int64")
 
-        return pd.Series(_series.astype(float).apply(np.floor), dtype = "Int64")
+        if self.downcast:
+            return pd.to_numeric(_series, downcast = "integer")
+        return _series
 
 class StringColumn(Column):
     """
         Class representing `DataType.STRING` columns.
+
+        The class provides attributes that could be used to define 
+        the properties of the string column, such as:
+
+        - `categorical`: flag to store the parsed values as `category` 
+            when the column has a low cardinality. By default, the flag 
+            is set to `False`.
     """
 
+    __slots__ = ("categorical",)
+
+    categorical: bool
+    """Flag to store low cardinality columns as `category`."""
+
+    categorical_sample_size: int = 10_000
+    """Number of values sampled to estimate the cardinality of the column."""
+
+    categorical_max_ratio: float = 0.5
+    """Maximum ratio between unique and total values to use `category`."""
+
     def __init__(
         self,
         name: str,
         parser: ColumnParser | None = None,
-        order: int | None = None
+        order: int | None = None,
+        categorical: bool = False
     ):
 
+        self.categorical = categorical
         self.parser: ColumnParser # type: ignore
 
+        logger.debug(f"categorical: {self.categorical}")
+
         # set default parser
         if parser is None:
             logger.debug("set default parser")
@@ -381,6 +489,11 @@ class StringColumn(Column):
             converts the column to string type and replaces the null values
             with `None`.
 
+            If `categorical` is set, the cardinality is estimated on the first 
+            `categorical_sample_size` values; if the ratio of unique values is 
+            lower than `categorical_max_ratio`, then the column is converted 
+            to `category` type.
+
             Parameters:
                 series: `pandas` series to be parsed.
 
@@ -388,7 +501,17 @@ class StringColumn(Column):
                 `pandas` series parsed
         """
         _series_nulls = series.isnull()
-        return series.astype("str").where(~_series_nulls, None)
+        _series = series.astype("str")
+        if _series_nulls.any():
+            _series = _series.where(~_series_nulls, None)
+
+        if self.categorical:
+            _sample = _series.iloc[:self.categorical_sample_size]
+            if len(_sample) > 0 and _sample.nunique() / len(_sample) < self.categorical_max_ratio:
+                logger.debug("low cardinality, convert to category")
+                return _series.astype("category")
+
+        return _series
 
 class BooleanColumn(Column):
     """
@@ -406,6 +529,8 @@ class BooleanColumn(Column):
         the boolean column using `pandas`.
     """
 
+    __slots__ = ("true_value", "false_value")
+
     true_value: str | int | float
     """Value to be used to represent the `True` value."""
 
@@ -470,6 +595,8 @@ class DatetimeColumn(Column):
         the datetime column using `pandas`.
     """
 
+    __slots__ = ("format", "null_default_value")
+
     format: str
     """Format to be used to parse the datetime."""
 
@@ -519,6 +646,11 @@ class DatetimeColumn(Column):
 
             Finally, the function fills the null values with the default value, if set.
 
+            Observe that each distinct value is parsed only once, and the result is 
+            mapped back to the series; this is useful because datetime columns 
+            usually contain many repeated values.
+            Series already of datetime type are not parsed again.
+
             If the `null_default_value` is set, the function fills the null values
             with the default value.
 
@@ -535,35 +667,66 @@ class DatetimeColumn(Column):
         """
 
         _series: PandasSeries
-        _series_nulls = series.isnull()
 
-        try:
-            _series = pd.Series(pd.NaT, index = series.index)
-            _series_dt = pd.to_datetime(series.dropna().astype("str"), errors = mode.value, format = self.format) # type: ignore (pandas issue in typing)
-            _series.loc[_series_dt.index] = _series_dt
-        except OutOfBoundsDatetime as e:
-            logger.warning("[WARNING] switched to 'slow' mode due to out of bounds datetimes")
-            logger.debug(f"[WARNING] parsing datetime: {e}")
-            _series = pd.to_datetime(series.astype("str"), errors = "coerce", format = self.format)
-            _series_not_casted = _series.isnull() & ~_series_nulls
-            _series_to_cast = series.where(_series_not_casted, None)
-            _series = _series.where(~_series_not_casted, _series_to_cast.dropna().apply(parser.parse))
-        except Exception as e:
-            logger.error(f"error parsing datetime: {e}")
-            raise ColumnParserPandasDatetimeError(f"error parsing datetime: {e}")
+        if series.dtype.kind == "M":
+            # already parsed, no round trip through strings
+            logger.debug("series already of datetime type")
+            _series = series
+            _nulls = series.isnull().to_numpy()
+        else:
+            # nulls are encoded as -1
+            _codes, _uniques = pd.factorize(series)
+
+            try:
+                # parse only unique values
+                _uniques_str = pd.Series(_uniques, dtype = series.dtype).astype("str")
+                _uniques_parsed = pd.to_datetime(_uniques_str, errors = mode.value, format = self.format) # type: ignore (pandas issue in typing)
+                if _uniques_parsed.dtype.kind == "M":
+                    _uniques_dt = pd.DatetimeIndex(_uniques_parsed)
+                    _series = pd.Series(_uniques_dt.take(_codes, allow_fill = True, fill_value = pd.NaT), index = series.index)
+                else:
+                    # values left unparsed (IGNORE mode), nulls mapped to NaT
+                    _values = np.append(np.asarray(_uniques_parsed, dtype = object), pd.NaT)
+                    _series = pd.Series(_values[_codes], index = series.index)
+            except OutOfBoundsDatetime as e:
+                logger.warning("[WARNING] switched to 'slow' mode due to out of bounds datetimes")
+                logger.debug(f"[WARNING] parsing datetime: {e}")
+                _series = pd.to_datetime(series.astype("str"), errors = "coerce", format = self.format)
+                _series_nulls = pd.Series(_codes == -1, index = series.index)
+                _series_not_casted = _series.isnull() & ~_series_nulls
+                _series_to_cast = series.where(_series_not_casted, None)
+                _series_to_cast = _series_to_cast.dropna()
+                _series_parsed = _series_to_cast.map({value: parser.parse(value) for value in _series_to_cast.unique()})
+                _series = _series.where(~_series_not_casted, _series_parsed)
+            except Exception as e:
+                # positions refer to the unique values, map them back to the series
+                _message = str(e)
+                _position = re.search(r"at position (\d+)", _message)
+                if _position is not None:
+                    _rows = np.flatnonzero(_codes == int(_position.group(1)))
+                    if _rows.size > 0:
+                        _message = _message.replace(_position.group(0), f"at position {_rows[0]}")
+
+                logger.error(f"error parsing datetime: {_message}")
+                raise ColumnParserPandasDatetimeError(f"error parsing datetime: {_message}")
+
+            _nulls = _codes == -1
+
+        if self.null_default_value is None:
+            return _series
 
         logger.debug("update null values")
-        if _series_nulls.sum() > 0 and self.null_default_value is not None:
+        if _nulls.any():
             logger.info("fill nulls")
 
             if (
                     self.null_default_value >= pd.Timestamp.min
                 and self.null_default_value <= pd.Timestamp.max
-                and "datetime64" in _series.dtype.name
+                and _series.dtype.kind == "M"
             ):
                 _series = _series.fillna(self.null_default_value)
             else:
-                _series = _series.mask(_series_nulls, self.null_default_value)
+                _series = _series.mask(pd.Series(_nulls, index = series.index), self.null_default_value)
 
         return _series
 
@@ -592,6 +755,8 @@ class DateColumn(DatetimeColumn):
             `ColumnDateFormatterError`: error raised when the date format contains a time part.
     """
 
+    __slots__ = ()
+
     def __init__(self,
         name: str,
         format: str = "%Y-%m-%d",
@@ -12,33 +12,28 @@ class ColumnDateFormatterError(HamanaException):
     """
         Exception raised when there is not admitted date format.
     """
-    def __init__(self, description):
-        super().__init__(description)
+    pass
 
 class ColumnParserPandasNumberError(HamanaException):
     """
         Exception raised when there is an error parsing a number column
     """
-    def __init__(self, description):
-        super().__init__(description)
+    pass
 
 class ColumnParserPandasDatetimeError(HamanaException):
     """
         Exception raised when there is an error parsing a datetime column
     """
-    def __init__(self, description):
-        super().__init__(description)
+    pass
 
 class ColumnIdentifierError(HamanaException):
     """
         Exception raised when there is an error identifying a column.
     """
-    def __init__(self, description):
-        super().__init__(description)
+    pass
 
 class ColumnIdentifierEmptySeriesError(HamanaException):
     """
         Exception raised when a series is empty.
     """
-    def __init__(self, description):
-        super().__init__(description)
\ No newline at end of file
+    pass
\ No newline at end of file
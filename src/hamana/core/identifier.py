@@ -1,3 +1,4 @@
+import re
 import logging
 from dataclasses import dataclass
 from collections.abc import Callable
@@ -14,6 +15,19 @@ TColumn = TypeVar("TColumn", bound = Column, covariant = True)
 # set logging
 logger = logging.getLogger(__name__)
 
+# patterns shared by the default identifiers
+_NOT_NUMBER_CHARS_RE = re.compile(r"[^0-9\.\-\+\,eE]")
+_COMMA_RE = re.compile(r"\,")
+_DOT_RE = re.compile(r"\.")
+_NUMBER_DOT_DECIMAL_RE = re.compile(r"^[+-]?(\d+(\,\d{3})*|\d{1,2})(\.\d+)?([eE][+-]?\d+)?$")
+_NUMBER_COMMA_DECIMAL_RE = re.compile(r"^[+-]?(\d+(\.\d{3})*|\d{1,2})(\,\d+)?([eE][+-]?\d+)?$")
+_ZERO_DECIMAL_RE = re.compile(r"\.0$")
+_INTEGER_RE = {
+    separator: re.compile(rf"^[+-]?(\d+(\{separator}" + r"\d{3})*|\d{1,2})$")
+    for separator in (",", ".")
+}
+_STRING_RE = re.compile(r"^[A-Za-z\d\W]+$")
+
 class PandasIdentifier(Protocol[TColumn]):
     """
         Protocol representing an identifier for `pandas` series.
@@ -36,7 +50,7 @@ class PandasIdentifier(Protocol[TColumn]):
     def __call__(self, series: PandasSeries, column_name: str, order: int | None = None, *args: Any, **kwargs: Any) -> TColumn | None:
         ...
 
-@dataclass
+@dataclass(slots = True)
 class ColumnIdentifier(Generic[TColumn]):
     """
         Class representing an identifier for a column in the `hamana` library.
@@ -220,27 +234,27 @@ def _default_numeric_pandas(series: PandasSeries, column_name: str, order: int |
 
     # check letters presence
     logger.debug("check letters")
-    if _series.str.replace(r"[0-9\.\-\+\,eE]", "", regex = True).str.len().sum() > 0:
+    if _series.str.contains(_NOT_NUMBER_CHARS_RE).any():
         logger.warning("letters found, no number column")
         return None
 
     # check separators
-    comma_separator_count = _series.str.replace(r"[0-9\.\-\+eE]", "", regex = True).str.len().max()
+    comma_separator_count = _series.str.count(_COMMA_RE).max()
     logger.debug(f"comma separator count: {comma_separator_count}")
 
-    dot_separator_count   = _series.str.replace(r"[0-9\-\+\,eE]", "", regex = True).str.len().max()
+    dot_separator_count   = _series.str.count(_DOT_RE).max()
     logger.debug(f"dot separator count: {dot_separator_count}")
 
     if (
             dot_separator_count in [0, 1]
-        and _series.str.match(r"^[+-]?(\d+(\,\d{3})*|\d{1,2})(\.\d+)?([eE][+-]?\d+)?$").all()
+        and _series.str.match(_NUMBER_DOT_DECIMAL_RE).all()
     ):
         logger.info("possible number column: dot decimal separator, comma thousands separator")
         column = NumberColumn(name = column_name, decimal_separator = ".", thousands_separator = ",", order = order)
         column.inferred = True
     elif (
             comma_separator_count in [0, 1]
-        and _series.str.match(r"^[+-]?(\d+(\.\d{3})*|\d{1,2})(\,\d+)?([eE][+-]?\d+)?$").all()
+        and _series.str.match(_NUMBER_COMMA_DECIMAL_RE).all()
     ):
         logger.info("possible number column: comma decimal separator, dot thousands separator")
         column = NumberColumn(name = column_name, decimal_separator = ",", thousands_separator = ".", order = order)
@@ -298,13 +312,13 @@ def _default_integer_pandas(series: PandasSeries, column_name: str, order: int |
     logger.debug("number column inferred")
 
     # adjust series
-    _series = _series.str.replace(r"\.0$", "", regex = True)
+    _series = _series.str.replace(_ZERO_DECIMAL_RE, "", regex = True)
 
     # check separators
-    comma_separator_count = _series.str.replace(r"[0-9\.\-\+eE]", "", regex = True).str.len().max()
+    comma_separator_count = _series.str.count(_COMMA_RE).max()
     logger.debug(f"comma separator count: {comma_separator_count}")
 
-    dot_separator_count   = _series.str.replace(r"[0-9\-\+\,eE]", "", regex = True).str.len().max()
+    dot_separator_count   = _series.str.count(_DOT_RE).max()
     logger.debug(f"dot separator count: {dot_separator_count}")
 
     # infer thousands separator
@@ -317,8 +331,7 @@ def _default_integer_pandas(series: PandasSeries, column_name: str, order: int |
         thousands_separator = "."
         decimal_separator   = ","
 
-    int_regex = rf"^[+-]?(\d+(\{thousands_separator}" + r"\d{3})*|\d{1,2})$"
-    if thousands_separator is not None and _series.str.match(int_regex).all():
+    if thousands_separator is not None and _series.str.match(_INTEGER_RE[thousands_separator]).all():
         logger.info("integer column found")
         column = IntegerColumn(name = inferred_column.name, decimal_separator = decimal_separator, thousands_separator = thousands_separator, order = order)
         column.inferred = True
@@ -367,7 +380,7 @@ def _default_string_pandas(series: PandasSeries, column_name: str, order: int |
 
     # check values
     logger.debug("check values")
-    if _series.astype("str").str.match(r"^[A-Za-z\d\W]+$").any():
+    if _series.astype("str").str.match(_STRING_RE).any():
         logger.info("string column found")
         column = StringColumn(name = column_name, order = order)
         column.inferred = True
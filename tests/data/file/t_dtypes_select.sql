@@ -0,0 +1,2 @@
+SELECT *
+FROM T_DTYPES
\ No newline at end of file
@@ -56,6 +56,56 @@ def mock_oracle_connection(mocker: MockerFixture) -> MockerFixture:
 
     return mock_connection
 
+def test_thick_mode_enabled_once(mocker: MockerFixture) -> None:
+    """
+        Test that the thick mode loads the Oracle Client
+        libraries only once, even if many connectors
+        are created with the thick mode enabled.
+    """
+    mock_init = mocker.patch("hamana.connector.db.oracle.init_oracle_client")
+    mocker.patch.object(hm.connector.db.Oracle, "_thick_mode_enabled", False)
+
+    # connect to db
+    db = hm.connector.db.Oracle.new(user = "test", password = "test", host = "localhost", thick_mode = True, oracle_client_lib_dir = "/opt/oracle")
+    hm.connector.db.Oracle.new(user = "test", password = "test", host = "localhost", thick_mode = True)
+
+    # check
+    assert db.config.thick_mode
+    assert db.config.oracle_client_lib_dir == "/opt/oracle"
+    mock_init.assert_called_once_with(lib_dir = "/opt/oracle")
+
+    return
+
+def test_thin_mode_default(mocker: MockerFixture) -> None:
+    """Test that the thin mode is used by default."""
+    mock_init = mocker.patch("hamana.connector.db.oracle.init_oracle_client")
+
+    # connect to db
+    db = hm.connector.db.Oracle.new(user = "test", password = "test", host = "localhost")
+
+    # check
+    assert not db.config.thick_mode
+    mock_init.assert_not_called()
+
+    return
+
+def test_config_connect_params() -> None:
+    """
+        Test that the connection parameters reflect 
+        the current connection attributes.
+    """
+    config = hm.connector.db.Oracle.create_config(user = "test", password = "test", host = "localhost", service = "test")
+
+    connect_params = config.connect_params
+    assert connect_params.host == "localhost"
+    assert config.get_data_source_name() == connect_params.get_connect_string()
+
+    # updated
+    config.host = "remotehost"
+    assert config.connect_params.host == "remotehost"
+
+    return
+
 def test_execute_query_without_meta(mocker: MockerFixture, mock_oracle_connection: MockerFixture) -> None:
     """
         Test the execute method passing a simple query 
@@ -94,6 +144,28 @@ def test_execute_query_without_meta(mocker: MockerFixture, mock_oracle_connectio
 
     return
 
+@pytest.mark.parametrize("fetch_size", [0, 2, 3, 10])
+def test_execute_query_fetch_size(mocker: MockerFixture, mock_oracle_connection: MockerFixture, fetch_size: int) -> None:
+    """
+        Test the execute method providing the fetch size;
+        the result must not depend on the number of rows
+        fetched for each round trip.
+    """
+    # connect to db
+    db = hm.connector.db.Oracle.new(user = "test", password = "test", host = "localhost")
+
+    # execute query
+    mocker.patch("hamana.connector.db.oracle.OracleConnector._connect", return_value = mock_oracle_connection)
+    query = db.execute("SELECT * FROM T_DTYPES", fetch_size = fetch_size)
+
+    # check data
+    assert query.result.shape == (3, 6)
+    pd.testing.assert_series_equal(query.result.c_integer, pd.Series([1, 2, 3], dtype = "float64", name = "c_integer"))
+    pd.testing.assert_series_equal(query.result.c_text, pd.Series(["string_1", "string_2", "string_3"], dtype = "object", name = "c_text"))
+    pd.testing.assert_series_equal(query.result.c_datetime, pd.Series(["2021-01-01 01:01:01", "2021-01-02 01:01:01", "2021-01-03 01:01:01"], dtype = "datetime64[ns]", name = "c_datetime"))
+
+    return
+
 def test_execute_query_with_meta(mocker: MockerFixture, mock_oracle_connection: MockerFixture) -> None:
     """
         Test the execute method passing a simple query 
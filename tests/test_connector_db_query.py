@@ -1,11 +1,12 @@
 import pytest
+import sqlite3
 from pathlib import Path
 from datetime import datetime
 
 import pandas as pd
 
 import hamana as hm
-from hamana.connector.db.exceptions import QueryColumnsNotAvailable, QueryResultNotAvailable, QueryInitializationError
+from hamana.connector.db.exceptions import QueryColumnsNotAvailable, QueryResultNotAvailable, QueryInitializationError, TableAlreadyExists
 
 DB_SQLITE_TEST_PATH = "tests/data/db/test.db"
 
@@ -39,6 +40,24 @@ def test_load_query_from_file() -> None:
     query = hm.Query(file_path)
     assert query.query == "SELECT *\nFROM T_DTYPES"
 
+def test_load_query_inline() -> None:
+    """Test that inline queries are not treated as file paths."""
+
+    assert hm.Query("SELECT 1").query == "SELECT 1"
+    assert hm.Query("SELECT *\nFROM tests/data/file/t_dtypes_select.sql").query == "SELECT *\nFROM tests/data/file/t_dtypes_select.sql"
+
+def test_load_query_from_file_cached(tmp_path: Path) -> None:
+    """Test that the file content is cached and reloaded when the file changes."""
+
+    file_path = tmp_path / "query.sql"
+    file_path.write_text("SELECT 1")
+    assert hm.Query(file_path).query == "SELECT 1"
+    assert hm.Query(file_path).query == "SELECT 1"
+
+    # update file
+    file_path.write_text("SELECT 22")
+    assert hm.Query(file_path).query == "SELECT 22"
+
 def test_load_query_from_file_error() -> None:
     """Test used to define a query from file with an error."""
 
@@ -46,6 +65,21 @@ def test_load_query_from_file_error() -> None:
     with pytest.raises(QueryInitializationError):
         hm.Query(file_path)
 
+def test_get_params_cached() -> None:
+    """Test that the parameters dictionary is cached and invalidated on reassignment."""
+
+    query = hm.Query(query = "SELECT * FROM users WHERE id = :id", params = [hm.query.QueryParam(name = "id", value = 1)])
+    params = query.get_params()
+    assert params == {"id": 1}
+    assert query.get_params() is params
+
+    # reassign
+    query.params = [hm.query.QueryParam(name = "id", value = 2)]
+    assert query.get_params() == {"id": 2}
+
+    query.params = {"id": 3}
+    assert query.get_params() == {"id": 3}
+
 def test_get_create_query_success() -> None:
     """Test get_create_query method."""
 
@@ -67,6 +101,22 @@ def test_get_create_query_no_columns() -> None:
         query.get_create_query("users")
     return
 
+def test_adjust_df_consecutive_calls() -> None:
+    """Test that each DataFrame is parsed, even if its dtypes match a previous adjusted output."""
+
+    query = hm.Query(
+        query = "SELECT * FROM flags",
+        columns = [hm.column.BooleanColumn(order = 1, name = "flag")]
+    )
+
+    # first adjustment, the output keeps object dtype because of the null
+    df = query.adjust_df(pd.DataFrame({"flag": ["Y", None]}))
+    assert df["flag"].to_list()[0] is True
+
+    # second adjustment, same raw dtype of the previous output
+    df = query.adjust_df(pd.DataFrame({"flag": ["Y", "N"]}))
+    assert df["flag"].to_list() == [True, False]
+
 def test_to_sqlite_success() -> None:
     """
         Test to_sqlite method with a succesfull response.  
@@ -103,6 +153,10 @@ def test_to_sqlite_success() -> None:
     # insert
     query.to_sqlite("T_QUERY_TO_SQLITE")
 
+    # check result not modified
+    assert query.result.c_boolean.dtype == "bool"
+    assert query.result.c_datetime.dtype == "datetime64[ns]"
+
     # check (no columns metadata)
     query_on_db = hm.execute("SELECT * FROM T_QUERY_TO_SQLITE")
     assert query_on_db.columns is not None
@@ -126,6 +180,208 @@ def test_to_sqlite_success() -> None:
     hm.disconnect()
     return
 
+@pytest.mark.parametrize("method", ["multi", None])
+def test_to_sqlite_chunksize(method) -> None:
+    """
+        Test to_sqlite method inserting the data in batches.
+        The maximum number of variables is reduced to ensure
+        that the batch size is adjusted for the multi-row INSERT.
+    """
+
+    # create query
+    query = hm.Query(
+        query = "SELECT * FROM T_QUERY_TO_SQLITE_CHUNK",
+        columns = [
+            hm.column.IntegerColumn(order = 1, name = "c_integer"),
+            hm.column.StringColumn(order = 2, name = "c_text")
+        ]
+    )
+    query.result = pd.DataFrame({
+        "c_integer": list(range(5)),
+        "c_text": [f"text_{i}" for i in range(5)]
+    })
+
+    # init database
+    hm.connect()
+    hm.connector.db.Hamana.get_instance().get_connection().setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 3)
+
+    # insert
+    query.to_sqlite("T_QUERY_TO_SQLITE_CHUNK", chunksize = 2, method = method)
+
+    # check
+    query_on_db = hm.execute("SELECT * FROM T_QUERY_TO_SQLITE_CHUNK")
+    pd.testing.assert_frame_equal(query_on_db.result, query.result)
+
+    hm.disconnect()
+    return
+
+@pytest.mark.parametrize("mode", [hm.connector.db.schema.SQLiteDataImportMode.REPLACE, hm.connector.db.schema.SQLiteDataImportMode.APPEND])
+def test_to_sqlite_executemany(mode) -> None:
+    """Test to_sqlite method inserting the data with executemany."""
+
+    # create query
+    query = hm.Query(
+        query = "SELECT * FROM T_QUERY_TO_SQLITE_MANY",
+        columns = [
+            hm.column.IntegerColumn(order = 1, name = "c_integer"),
+            hm.column.StringColumn(order = 2, name = "c_text"),
+            hm.column.BooleanColumn(order = 3, name = "c_boolean"),
+            hm.column.DateColumn(order = 4, name = "c_date")
+        ]
+    )
+    query.result = pd.DataFrame({
+        "c_integer": [1, 2],
+        "c_text": ["a", None],
+        "c_boolean": [True, False],
+        "c_date": [datetime(2021, 1, 1), datetime(2021, 12, 31)]
+    })
+
+    # init database
+    hm.connect()
+
+    # insert (twice)
+    query.to_sqlite("T_QUERY_TO_SQLITE_MANY", mode = mode, method = "executemany")
+    query.to_sqlite("T_QUERY_TO_SQLITE_MANY", mode = mode, method = "executemany")
+
+    # check
+    query_on_db = hm.execute("SELECT * FROM T_QUERY_TO_SQLITE_MANY")
+    n_repeat = 2 if mode == hm.connector.db.schema.SQLiteDataImportMode.APPEND else 1
+    assert query_on_db.result.shape == (2 * n_repeat, 4)
+    assert query_on_db.result.c_integer.to_list() == [1, 2] * n_repeat
+    assert query_on_db.result.c_boolean.to_list() == [1, 0] * n_repeat
+    assert query_on_db.result.c_date.to_list() == [pd.Timestamp(2021, 1, 1), pd.Timestamp(2021, 12, 31)] * n_repeat
+
+    # fail mode
+    with pytest.raises(TableAlreadyExists):
+        query.to_sqlite("T_QUERY_TO_SQLITE_MANY", mode = hm.connector.db.schema.SQLiteDataImportMode.FAIL, method = "executemany")
+
+    hm.disconnect()
+    return
+
+def test_to_sqlite_executemany_nulls() -> None:
+    """Test to_sqlite method inserting nullable integer and datetime columns with executemany."""
+
+    # create query
+    query = hm.Query(
+        query = "SELECT * FROM T_QUERY_TO_SQLITE_MANY_NULLS",
+        columns = [
+            hm.column.IntegerColumn(order = 1, name = "c_integer", null_default_value = None),
+            hm.column.DatetimeColumn(order = 2, name = "c_datetime")
+        ]
+    )
+    query.result = pd.DataFrame({
+        "c_integer": pd.Series([1, pd.NA], dtype = "Int64"),
+        "c_datetime": pd.Series([datetime(2021, 1, 1, 1, 1, 1), pd.NaT], dtype = "datetime64[ns]")
+    })
+
+    # init database
+    hm.connect()
+
+    # insert
+    query.to_sqlite("T_QUERY_TO_SQLITE_MANY_NULLS", method = "executemany")
+
+    # check raw rows
+    connection = hm.connector.db.Hamana.get_instance().get_connection()
+    rows = connection.execute("SELECT * FROM T_QUERY_TO_SQLITE_MANY_NULLS").fetchall()
+    assert rows == [(1, 20210101010101), (None, None)]
+
+    # close connection
+    hm.disconnect()
+    return
+
+@pytest.mark.parametrize("method", ["multi", "executemany"])
+def test_to_sqlite_bulk(tmp_path: Path, method) -> None:
+    """Test to_sqlite method in bulk mode, checking that the PRAGMAs are restored."""
+
+    # create query
+    query = hm.Query(
+        query = "SELECT * FROM T_QUERY_TO_SQLITE_BULK",
+        columns = [
+            hm.column.IntegerColumn(order = 1, name = "c_integer"),
+            hm.column.StringColumn(order = 2, name = "c_text")
+        ]
+    )
+    query.result = pd.DataFrame({
+        "c_integer": list(range(100)),
+        "c_text": [f"text_{i}" for i in range(100)]
+    })
+
+    # init database
+    hm.connect(tmp_path / "bulk.db")
+    connection = hm.connector.db.Hamana.get_instance().get_connection()
+    pragmas = [connection.execute(f"PRAGMA {name}").fetchone()[0] for name in ["synchronous", "journal_mode", "temp_store"]]
+
+    # insert
+    query.to_sqlite("T_QUERY_TO_SQLITE_BULK", method = method, bulk = True)
+
+    # check
+    query_on_db = hm.execute("SELECT * FROM T_QUERY_TO_SQLITE_BULK")
+    pd.testing.assert_frame_equal(query_on_db.result, query.result)
+    assert [connection.execute(f"PRAGMA {name}").fetchone()[0] for name in ["synchronous", "journal_mode", "temp_store"]] == pragmas
+
+    hm.disconnect()
+    return
+
+def test_sqlite_bulk_pragmas_transaction(tmp_path: Path) -> None:
+    """
+        Test that `sqlite_bulk_pragmas` rolls back on error only the 
+        transaction started inside the context, leaving untouched 
+        the one already open on entry.
+    """
+    connection = sqlite3.connect(tmp_path / "bulk.db")
+    connection.execute("CREATE TABLE T_BULK (c_integer INTEGER)")
+    connection.commit()
+
+    # transaction started inside the context
+    with pytest.raises(sqlite3.IntegrityError):
+        with hm.query.sqlite_bulk_pragmas(connection):
+            connection.execute("INSERT INTO T_BULK VALUES (1)")
+            raise sqlite3.IntegrityError("error")
+    assert not connection.in_transaction
+    assert connection.execute("SELECT COUNT(1) FROM T_BULK").fetchone()[0] == 0
+
+    # transaction already open on entry
+    connection.execute("INSERT INTO T_BULK VALUES (2)")
+    with pytest.raises(sqlite3.IntegrityError):
+        with hm.query.sqlite_bulk_pragmas(connection):
+            raise sqlite3.IntegrityError("error")
+    assert connection.in_transaction
+    connection.commit()
+    assert connection.execute("SELECT c_integer FROM T_BULK").fetchall() == [(2,)]
+
+    connection.close()
+    return
+
+def test_to_sqlite_pyarrow() -> None:
+    """Test to_sqlite method with `pyarrow` backed columns."""
+    pytest.importorskip("pyarrow")
+
+    # create query
+    query = hm.Query(
+        query = "SELECT * FROM T_QUERY_TO_SQLITE_ARROW",
+        columns = [
+            hm.column.BooleanColumn(order = 1, name = "c_boolean"),
+            hm.column.DatetimeColumn(order = 2, name = "c_datetime")
+        ]
+    )
+    query.result = pd.DataFrame({
+        "c_boolean": pd.Series([True, False, None], dtype = "bool[pyarrow]"),
+        "c_datetime": pd.Series([datetime(2021, 1, 1, 1, 1, 1)] * 3, dtype = "timestamp[ns][pyarrow]")
+    })
+
+    # init database
+    hm.connect()
+
+    # insert
+    query.to_sqlite("T_QUERY_TO_SQLITE_ARROW")
+
+    # check (null values preserved)
+    rows = hm.connector.db.Hamana.get_instance().get_connection().execute("SELECT * FROM T_QUERY_TO_SQLITE_ARROW").fetchall()
+    assert rows == [(1, 20210101010101), (0, 20210101010101), (None, 20210101010101)]
+
+    hm.disconnect()
+    return
+
 def test_to_sqlite_missing_result() -> None:
     """Test to_sqlite method with missing result."""
 
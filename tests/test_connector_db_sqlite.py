@@ -1,3 +1,4 @@
+import sqlite3
 import pytest
 
 import numpy as np
@@ -246,6 +247,125 @@ def test_execute_query_missing_column() -> None:
     with pytest.raises(QueryColumnsNotAvailable):
         db.execute(query)
 
+@pytest.mark.parametrize("raw_insert", [True, False])
+@pytest.mark.parametrize("bulk", [True, False])
+def test_to_sqlite_table_batches(raw_insert: bool, bulk: bool) -> None:
+    """
+        Test the `to_sqlite` method inserting the data 
+        in several batches, with and without bulk mode.
+    """
+    # init database
+    hm.connect()
+    connection = hm.connector.db.Hamana.get_instance().get_connection()
+    journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+    # save to SQLite
+    query_input = hm.Query("SELECT * FROM T_DTYPES")
+    db = hm.connector.db.SQLite(DB_SQLITE_TEST_PATH)
+    db.to_sqlite(query_input, "T_DB_SQLITE_TO_SQLITE_BATCHES", raw_insert = raw_insert, batch_size = 1, bulk = bulk)
+
+    # check result
+    query = hm.Query(query = "SELECT c_integer FROM T_DB_SQLITE_TO_SQLITE_BATCHES")
+    hm.execute(query)
+    assert query.result.c_integer.to_list() == db.execute("SELECT c_integer FROM T_DTYPES").result.c_integer.to_list()
+    assert not connection.in_transaction
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == journal_mode
+
+    hm.disconnect()
+    return
+
+def test_fast_reads() -> None:
+    """Test the connection PRAGMAs set with `fast_reads` option."""
+
+    db = hm.connector.db.SQLite(DB_SQLITE_TEST_PATH, fast_reads = True)
+    with db:
+        assert db.connection.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert db.connection.execute("PRAGMA cache_size").fetchone()[0] == -65_536
+
+    # extraction
+    query = db.execute("SELECT * FROM T_DTYPES")
+    assert query.result.shape[0] > 0
+
+def test_batch_execute_overlapped() -> None:
+    """
+        Test the `batch_execute_overlapped` method by
+        comparing its batches with the ones returned
+        by `batch_execute` on the `T_DTYPES` table.
+    """
+
+    # connect to db
+    db = hm.connector.db.SQLite(DB_SQLITE_TEST_PATH)
+
+    # execute queries
+    query = hm.Query("SELECT * FROM T_DTYPES")
+    batches = list(db.batch_execute(query, batch_size = 2))
+
+    query_overlapped = hm.Query("SELECT * FROM T_DTYPES")
+    batches_overlapped = list(db.batch_execute_overlapped(query_overlapped, batch_size = 2, queue_size = 1))
+
+    # check result
+    assert batches_overlapped == batches
+    assert [len(batch) for batch in batches_overlapped] == [2, 1]
+    assert query_overlapped.columns == query.columns
+
+def test_batch_execute_overlapped_private_connection() -> None:
+    """
+        Test that the connector can be used while the batches 
+        of `batch_execute_overlapped` are consumed; the background 
+        thread must use its own connection.
+    """
+
+    # connect to db
+    db = hm.connector.db.SQLite(DB_SQLITE_TEST_PATH)
+
+    # execute queries while consuming the batches
+    batches = []
+    counts = []
+    for batch in db.batch_execute_overlapped(hm.Query("SELECT * FROM T_DTYPES"), batch_size = 1, queue_size = 1):
+        batches.append(batch)
+        counts.append(db.execute("SELECT COUNT(1) AS n FROM T_DTYPES").result.n.iloc[0])
+
+    # check result
+    assert [len(batch) for batch in batches] == [1, 1, 1]
+    assert counts == [3, 3, 3]
+
+def test_batch_execute_overlapped_shared_connection() -> None:
+    """
+        Test `batch_execute_overlapped` on `HamanaConnector`, whose 
+        connection is shared and bound to the calling thread; the 
+        batches are fetched without background thread.
+    """
+
+    # init database
+    hm.connect(DB_SQLITE_TEST_PATH)
+    db = hm.connector.db.Hamana.get_instance()
+
+    # execute queries while consuming the batches
+    batches = []
+    for batch in db.batch_execute_overlapped(hm.Query("SELECT * FROM T_DTYPES"), batch_size = 2):
+        batches.append(batch)
+        db.execute("SELECT COUNT(1) FROM T_DTYPES")
+
+    # check result
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches == list(db.batch_execute(hm.Query("SELECT * FROM T_DTYPES"), batch_size = 2))
+
+    # close connection
+    hm.disconnect()
+
+def test_batch_execute_overlapped_error() -> None:
+    """
+        Ensure that errors raised while fetching the
+        batches in background are propagated to the caller.
+    """
+
+    # connect to db
+    db = hm.connector.db.SQLite(DB_SQLITE_TEST_PATH)
+
+    # execute query
+    with pytest.raises(sqlite3.OperationalError):
+        list(db.batch_execute_overlapped(hm.Query("SELECT * FROM T_NOT_EXISTS"), batch_size = 2))
+
 """
     Test `to_sqlite` method.
     Table used: `T_DB_SQLITE_*`
@@ -51,6 +51,77 @@ def mock_db_connection(mocker: MockerFixture) -> MockerFixture:
 
     return mock_connection
 
+def test_connection_params() -> None:
+    """Test the connection parameters passed to `teradatasql`."""
+
+    db = hm.connector.db.Teradata(user = "user", password = None, host = "host", tmode = "ANSI")
+    assert db._get_connection_params() == {
+        "user": "user",
+        "host": "host",
+        "dbs_port": 1025,
+        "logmech": "LDAP",
+        "tmode": "ANSI"
+    }
+
+def test_connection_pool(mocker: MockerFixture) -> None:
+    """Test that pooled connections are reused across queries."""
+    mock_connection = mocker.patch("hamana.connector.db.teradata.Connection")
+
+    db = hm.connector.db.Teradata(user = "user", password = "password", host = "host", pool_size = 1)
+    with db:
+        pass
+    with db:
+        pass
+
+    # single logon, connection kept open
+    assert mock_connection.call_count == 1
+    mock_connection.return_value.close.assert_not_called()
+
+    db.close_pool()
+    mock_connection.return_value.close.assert_called_once()
+
+def test_connection_pool_dropped(mocker: MockerFixture) -> None:
+    """Test that pooled connections not alive or expired are replaced."""
+    connections = [mocker.MagicMock(), mocker.MagicMock(), mocker.MagicMock()]
+    mock_connection = mocker.patch("hamana.connector.db.teradata.Connection", side_effect = connections)
+
+    db = hm.connector.db.Teradata(user = "user", password = "password", host = "host", pool_size = 1)
+    with db:
+        pass
+
+    # connection dropped by the server
+    connections[0].cursor.return_value.execute.side_effect = Exception("connection lost")
+    with db:
+        assert db.connection is connections[1]
+    connections[0].close.assert_called_once()
+
+    # connection idle for too long
+    db.pool_idle_timeout = -1
+    with db:
+        assert db.connection is connections[2]
+    connections[1].close.assert_called_once()
+
+    assert mock_connection.call_count == 3
+    db.close_pool()
+
+def test_connection_pool_full(mocker: MockerFixture) -> None:
+    """Test that connections not fitting in the pool are closed."""
+    connections = [mocker.MagicMock(), mocker.MagicMock()]
+    mocker.patch("hamana.connector.db.teradata.Connection", side_effect = connections)
+
+    db = hm.connector.db.Teradata(user = "user", password = "password", host = "host", pool_size = 1)
+    with db:
+        pass
+
+    # another connection released while the pool is full
+    db.connection = connections[1]
+    db.__exit__(None, None, None)
+    connections[1].close.assert_called_once()
+    connections[0].close.assert_not_called()
+
+    db.close_pool()
+    connections[0].close.assert_called_once()
+
 def test_execute_query_without_meta(mocker: MockerFixture, mock_db_connection: MockerFixture) -> None:
     """
         Test the execute method passing a simple query 
@@ -44,6 +44,15 @@ def test_connect_success():
     db.close()
     return
 
+def test_connect_fast_reads():
+    """Test that the fast reads PRAGMAs are set on the internal connection."""
+
+    db = HamanaConnector(fast_reads = True)
+    assert db.get_connection().execute("PRAGMA cache_size").fetchone()[0] == -65_536
+
+    db.close()
+    return
+
 def test_singleton_behavior():
     """Test that only one instance of HamanaConnector is created."""
 
@@ -11,6 +11,52 @@ from hamana.core.exceptions import (
     ColumnDateFormatterError
 )
 
+# DataType
+@pytest.mark.parametrize("series, dtype", [
+    (pd.Series([1, 2]), hm.column.DataType.INTEGER),
+    (pd.Series([1, 2], dtype = "uint8"), hm.column.DataType.INTEGER),
+    (pd.Series([1, None], dtype = "Int64"), hm.column.DataType.INTEGER),
+    (pd.Series([1.0, 2.0]), hm.column.DataType.NUMBER),
+    (pd.Series(["a", "b"]), hm.column.DataType.STRING),
+    (pd.Series([True, False]), hm.column.DataType.BOOLEAN),
+    (pd.Series([datetime(2021, 1, 1)]), hm.column.DataType.DATETIME),
+    (pd.Series([pd.Timedelta(1)]), hm.column.DataType.STRING)
+])
+def test_datatype_from_pandas(series: pd.Series, dtype: hm.column.DataType) -> None:
+    """Test the mapping of pandas datatypes provided as dtype objects."""
+
+    assert hm.column.DataType.from_pandas(series.dtype) == dtype
+
+@pytest.mark.parametrize("name, dtype", [
+    ("int64", hm.column.DataType.INTEGER),
+    ("int32", hm.column.DataType.INTEGER),
+    ("float64", hm.column.DataType.NUMBER),
+    ("object", hm.column.DataType.STRING),
+    ("bool", hm.column.DataType.BOOLEAN),
+    ("datetime64[ns]", hm.column.DataType.DATETIME),
+    ("category", hm.column.DataType.STRING)
+])
+def test_datatype_from_pandas_name(name: str, dtype: hm.column.DataType) -> None:
+    """Test the mapping of pandas datatypes provided as names."""
+
+    assert hm.column.DataType.from_pandas(name) == dtype
+
+# Column
+@pytest.mark.parametrize("column", [
+    hm.column.NumberColumn("number"),
+    hm.column.IntegerColumn("integer"),
+    hm.column.StringColumn("string"),
+    hm.column.BooleanColumn("boolean"),
+    hm.column.DatetimeColumn("datetime"),
+    hm.column.DateColumn("date")
+])
+def test_column_slots(column: hm.column.Column) -> None:
+    """Test that the columns are defined without instance dictionary."""
+
+    assert not hasattr(column, "__dict__")
+    with pytest.raises(AttributeError):
+        column.undefined_attribute = None # type: ignore
+
 # NumberColumn
 def test_column_number_std_parser_error() -> None:
     """Test the standard number parser with an invalid input."""
@@ -43,6 +89,27 @@ def test_column_number_not_std_parser() -> None:
 
     pd.testing.assert_series_equal(data_output, result)
 
+def test_column_number_downcast_parser() -> None:
+    """Test the number parser downcasting the result."""
+
+    data_input  = pd.Series(["", "0.5", "-1.25"])
+    data_output = pd.Series([np.nan, 0.5, -1.25], dtype = "float32")
+    column = hm.column.NumberColumn("downcast", downcast = True)
+    result = column.parser.pandas(data_input)
+
+    pd.testing.assert_series_equal(data_output, result)
+
+@pytest.mark.parametrize("column, data_input, data_output", [
+    (hm.column.NumberColumn("numeric", null_default_value = -1.0), pd.Series([1.5, np.nan, 3.0]), pd.Series([1.5, -1.0, 3.0])),
+    (hm.column.IntegerColumn("numeric"), pd.Series([1, np.nan, 3]), pd.Series([1, 0, 3]))
+])
+def test_column_number_numeric_input(column: hm.column.NumberColumn, data_input: pd.Series, data_output: pd.Series) -> None:
+    """Test the number parsers on a series that is already numeric."""
+
+    result = column.parser.pandas(data_input)
+
+    pd.testing.assert_series_equal(data_output, result)
+
 # IntegerColumn
 def test_column_integer_std_parser() -> None:
     """Test the standard integer parser with valid inputs, and the default values to 0."""
@@ -66,6 +133,19 @@ def test_column_integer_not_std_parser() -> None:
 
     pd.testing.assert_series_equal(data_output, result)
 
+@pytest.mark.parametrize("null_default_value, data_output", [
+    (0, pd.Series([0, 1, -300], dtype = "int16")),
+    (None, pd.Series([pd.NA, 1, -300], dtype = "Int16"))
+])
+def test_column_integer_downcast_parser(null_default_value: int | None, data_output: pd.Series) -> None:
+    """Test the integer parser downcasting the result."""
+
+    data_input  = pd.Series(["", "1", "-300"])
+    column = hm.column.IntegerColumn("downcast", null_default_value = null_default_value, downcast = True)
+    result = column.parser.pandas(data_input)
+
+    pd.testing.assert_series_equal(data_output, result)
+
 # StringColumn
 def test_column_string_std_parser() -> None:
     """Test the standard string parser with valid inputs."""
@@ -77,6 +157,20 @@ def test_column_string_std_parser() -> None:
 
     pd.testing.assert_series_equal(data_output, result)
 
+@pytest.mark.parametrize("data_input, dtype", [
+    (pd.Series(["a", "b", None, "a"] * 10), "category"),
+    (pd.Series([str(i) for i in range(40)]), "object")
+])
+def test_column_string_categorical_parser(data_input: pd.Series, dtype: str) -> None:
+    """Test the string parser with categorical flag, based on the cardinality."""
+
+    column = hm.column.StringColumn("categorical", categorical = True)
+    result = column.parser.pandas(data_input)
+
+    assert result.dtype == dtype
+    assert result.isnull().sum() == data_input.isnull().sum()
+    assert hm.column.DataType.from_pandas(result.dtype) == hm.column.DataType.STRING
+
 # BooleanColumn
 def test_column_boolean_std_parser() -> None:
     """Test the standard boolean parser with valid inputs."""
@@ -111,6 +205,52 @@ def test_column_datetime_std_parser_in_bound() -> None:
 
     pd.testing.assert_series_equal(pd.to_datetime(data_output), result)
 
+def test_column_datetime_std_parser_repeated_values() -> None:
+    """Test the standard datetime parser with repeated values."""
+
+    # Standard (format = "%Y-%m-%d %H:%M:%S")
+    data_input  = pd.Series(["2024-12-31 13:00:01", None, "2024-01-01 00:00:00", "2024-12-31 13:00:01"] * 25, index = range(100, 200))
+    data_output = pd.to_datetime(data_input)
+    column = hm.column.DatetimeColumn("standard")
+    result = column.parser.pandas(data_input)
+
+    pd.testing.assert_series_equal(data_output, result)
+
+@pytest.mark.parametrize("null_default_value, data_output", [
+    (None, pd.Series([pd.NaT, pd.NaT], dtype = "datetime64[ns]")),
+    (pd.Timestamp("2000-01-01"), pd.Series([pd.Timestamp("2000-01-01")] * 2, dtype = "datetime64[ns]"))
+])
+def test_column_datetime_std_parser_all_nulls(null_default_value: pd.Timestamp | None, data_output: pd.Series) -> None:
+    """Test the standard datetime parser on a series composed only by null values."""
+
+    data_input  = pd.Series([None, None])
+    column = hm.column.DatetimeColumn("standard", null_default_value = null_default_value)
+    result = column.parser.pandas(data_input)
+
+    pd.testing.assert_series_equal(data_output, result)
+
+@pytest.mark.filterwarnings("ignore:errors='ignore' is deprecated:FutureWarning")
+def test_column_datetime_std_parser_ignore() -> None:
+    """Test the standard datetime parser in ignore mode, leaving the unparsed values unchanged."""
+
+    data_input  = pd.Series(["2024-01-01 00:00:00", "garbage", None, "garbage"])
+    data_output = pd.Series(["2024-01-01 00:00:00", "garbage", pd.NaT, "garbage"], dtype = "object")
+    column = hm.column.DatetimeColumn("standard")
+    result = column.parser.pandas(data_input, mode = hm.core.column.PandasParsingModes.IGNORE)
+
+    pd.testing.assert_series_equal(data_output, result)
+
+@pytest.mark.filterwarnings("ignore:errors='ignore' is deprecated:FutureWarning")
+@pytest.mark.parametrize("mode", list(hm.core.column.PandasParsingModes))
+def test_column_datetime_std_parser_datetime_input(mode: hm.core.column.PandasParsingModes) -> None:
+    """Test the standard datetime parser on a series already of datetime type."""
+
+    data_input  = pd.Series([pd.Timestamp("2024-01-01"), None, pd.Timestamp("2024-12-31")], dtype = "datetime64[ns]")
+    column = hm.column.DatetimeColumn("standard")
+    result = column.parser.pandas(data_input, mode = mode)
+
+    pd.testing.assert_series_equal(data_input, result)
+
 def test_column_datetime_no_std_parser_out_of_bound_null() -> None:
     """Test the non-standard datetime parser with valid inputs, and the default values to None."""
 
@@ -147,6 +287,16 @@ def test_column_datetime_std_parser_error() -> None:
     with pytest.raises(ColumnParserPandasDatetimeError):
         column.parser.pandas(data_input)
 
+def test_column_datetime_std_parser_error_position() -> None:
+    """Test that the position reported on error refers to the input series."""
+
+    # Standard (format = "%Y-%m-%d %H:%M:%S")
+    data_input  = pd.Series(["2024-12-31 13:00:01", None, "2024-12-31 13:00:01", "2024-13-31 13:00:01"])
+    column = hm.column.DatetimeColumn("standard")
+
+    with pytest.raises(ColumnParserPandasDatetimeError, match = "at position 3"):
+        column.parser.pandas(data_input)
+
 # DateColumn
 def test_column_date_std_parser_out_of_bound() -> None:
     """Test the standard date parser with valid inputs, and the default values to None."""